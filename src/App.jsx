@@ -1,13 +1,17 @@
+import { lazy, Suspense } from 'react';
 import { BrowserRouter, Routes, Route, Navigate } from 'react-router-dom';
 import Header from './components/Header.jsx';
 import SessionInit from './components/SessionInit.jsx';
-import LiveSession from './pages/LiveSession.jsx';
-import BacktestSession from './pages/BacktestSession.jsx';
-import Report from './pages/Report.jsx';
 import { useSession } from './hooks/useSession.js';
 
+// A session only ever uses one entry mode, and Recharts only renders on the report,
+// so each page is its own chunk and loads on first visit
+const LiveSession = lazy(() => import('./pages/LiveSession.jsx'));
+const BacktestSession = lazy(() => import('./pages/BacktestSession.jsx'));
+const Report = lazy(() => import('./pages/Report.jsx'));
+
 export default function App() {
-  const { session, initSession, logTrade, setTrades, setAiAnalysis, newSession } = useSession();
+  const { session, initSession, setTrades, setAiAnalysis, newSession } = useSession();
 
   const hasSession = session?.mode !== null && session?.mode !== undefined;
 
@@ -15,45 +19,47 @@ export default function App() {
     <BrowserRouter>
       <div className="min-h-screen bg-[#0a0a0a] font-sans">
         {hasSession && <Header session={session} onExit={newSession} />}
-        <Routes>
-          <Route
-            path="/"
-            element={
-              hasSession
-                ? <Navigate to={session.mode === 'LIVE' ? '/live' : '/backtest'} replace />
-                : <SessionInit onInit={initSession} />
-            }
-          />
-          <Route
-            path="/live"
-            element={
-              !hasSession
-                ? <Navigate to="/" replace />
-                : session.mode !== 'LIVE'
-                ? <Navigate to="/backtest" replace />
-                : <LiveSession session={session} />
-            }
-          />
-          <Route
-            path="/backtest"
-            element={
-              !hasSession
-                ? <Navigate to="/" replace />
-                : session.mode !== 'BACKTEST'
-                ? <Navigate to="/live" replace />
-                : <BacktestSession session={session} setTrades={setTrades} />
-            }
-          />
-          <Route
-            path="/report"
-            element={
-              !hasSession
-                ? <Navigate to="/" replace />
-                : <Report session={session} setAiAnalysis={setAiAnalysis} newSession={newSession} />
-            }
-          />
-          <Route path="*" element={<Navigate to="/" replace />} />
-        </Routes>
+        <Suspense fallback={null}>
+          <Routes>
+            <Route
+              path="/"
+              element={
+                hasSession
+                  ? <Navigate to={session.mode === 'LIVE' ? '/live' : '/backtest'} replace />
+                  : <SessionInit onInit={initSession} />
+              }
+            />
+            <Route
+              path="/live"
+              element={
+                !hasSession
+                  ? <Navigate to="/" replace />
+                  : session.mode !== 'LIVE'
+                  ? <Navigate to="/backtest" replace />
+                  : <LiveSession session={session} />
+              }
+            />
+            <Route
+              path="/backtest"
+              element={
+                !hasSession
+                  ? <Navigate to="/" replace />
+                  : session.mode !== 'BACKTEST'
+                  ? <Navigate to="/live" replace />
+                  : <BacktestSession session={session} setTrades={setTrades} />
+              }
+            />
+            <Route
+              path="/report"
+              element={
+                !hasSession
+                  ? <Navigate to="/" replace />
+                  : <Report session={session} setAiAnalysis={setAiAnalysis} newSession={newSession} />
+              }
+            />
+            <Route path="*" element={<Navigate to="/" replace />} />
+          </Routes>
+        </Suspense>
       </div>
     </BrowserRouter>
   );
@@ -1,5 +1,4 @@
-import { useState, useEffect } from 'react';
-import Anthropic from '@anthropic-ai/sdk';
+import { useState, useEffect, useMemo } from 'react';
 
 const SECTIONS = [
   'STRATEGY OVERVIEW',
@@ -13,6 +12,30 @@ const SECTIONS = [
   'VERDICT',
 ];
 
+function parseAnalysis(text) {
+  if (!text) return [];
+  const sections = [];
+  const lines = text.split('\n');
+  let current = null;
+
+  for (const line of lines) {
+    // Upper-case each line once rather than per heading tried
+    const head = line.toUpperCase().trimStart();
+    const match = SECTIONS.find(s => head.startsWith(s + ':'));
+    if (match) {
+      if (current) sections.push(current);
+      current = {
+        title: match,
+        content: line.replace(new RegExp(`^${match}:?\\s*`, 'i'), '').trim()
+      };
+    } else if (current) {
+      current.content += (current.content ? '\n' : '') + line;
+    }
+  }
+  if (current) sections.push(current);
+  return sections;
+}
+
 export default function AIAnalysisPanel({ trades, stats, sessionName, aiAnalysis, onAnalysisComplete, triggerRef }) {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
@@ -39,8 +62,6 @@ export default function AIAnalysisPanel({ trades, stats, sessionName, aiAnalysis
       return;
     }
 
-    const client = new Anthropic({ apiKey, dangerouslyAllowBrowser: true });
-
     const tradeSummary = trades.slice(0, 50).map(t =>
       `T${t.tradeNum}: ${t.direction} | Entry:${t.entryPrice?.toFixed(4)} | ATR:${t.atr?.toFixed(4)} | SL:${t.slMultiple}x | TP:${t.tpMultiple}x | Lev:${t.leverage}x | ${t.outcome} | P&L:$${t.pnl?.toFixed(2)} | Capital:$${t.capitalAfter?.toFixed(2)}`
     ).join('\n');
@@ -59,6 +80,9 @@ Avg R:R: 1:${stats.avgRR?.toFixed(2)}
 Best SL Multiple: ${stats.bestSL}x | Best TP Multiple: ${stats.bestTP}x | Best Leverage: ${stats.bestLev}x` : '';
 
     try {
+      // The SDK is only fetched when an analysis is actually requested
+      const { default: Anthropic } = await import('@anthropic-ai/sdk');
+      const client = new Anthropic({ apiKey, dangerouslyAllowBrowser: true });
       const msg = await client.messages.create({
         model: 'claude-sonnet-4-20250514',
         max_tokens: 2000,
@@ -97,32 +121,8 @@ VERDICT: (must be exactly one of: STRONG EDGE DETECTED / REFINE AND RETEST / NO
     }
   }
 
-  function parseAnalysis(text) {
-    if (!text) return [];
-    const sections = [];
-    const lines = text.split('\n');
-    let current = null;
-
-    for (const line of lines) {
-      const match = SECTIONS.find(s =>
-        line.toUpperCase().trimStart().startsWith(s + ':') ||
-        line.toUpperCase().trim() === s + ':'
-      );
-      if (match) {
-        if (current) sections.push(current);
-        current = {
-          title: match,
-          content: line.replace(new RegExp(`^${match}:?\\s*`, 'i'), '').trim()
-        };
-      } else if (current) {
-        current.content += (current.content ? '\n' : '') + line;
-      }
-    }
-    if (current) sections.push(current);
-    return sections;
-  }
-
-  const sections = aiAnalysis ? parseAnalysis(aiAnalysis) : [];
+  // Re-parse only when a new analysis arrives, not on every loading/error toggle
+  const sections = useMemo(() => parseAnalysis(aiAnalysis), [aiAnalysis]);
   const verdict = sections.find(s => s.title === 'VERDICT');
   const verdictText = verdict?.content?.trim() || '';
   const verdictColor = verdictText.includes('STRONG EDGE') ? '#00E676'
@@ -132,7 +132,7 @@ VERDICT: (must be exactly one of: STRONG EDGE DETECTED / REFINE AND RETEST / NO
   return (
     <div className="terminal-panel" style={{ marginTop: '1rem' }}>
       <div className="panel-header">
-        <span style={{ display: 'inline-block', width: 8, height: 8, background: '#FF6600' }}></span>
+        <span className="panel-marker" />
         AI STRATEGY ANALYSIS
         <span style={{ color: '#333333', fontFamily: "Helvetica, Arial, sans-serif", fontSize: '1.0625rem', marginLeft: '0.5rem' }}>
           claude-sonnet-4-20250514
@@ -184,12 +184,6 @@ VERDICT: (must be exactly one of: STRONG EDGE DETECTED / REFINE AND RETEST / NO
             <div style={{ color: '#444444', fontFamily: "Helvetica, Arial, sans-serif", fontSize: '1.0625rem' }}>
               Sending {trades.length} trades to Claude API...
             </div>
-            <style>{`
-              @keyframes barPulse {
-                from { transform: scaleY(0.4); opacity: 0.2; }
-                to { transform: scaleY(1); opacity: 1; }
-              }
-            `}</style>
           </div>
         )}
 
@@ -1,5 +1,6 @@
-import { useState, useRef } from 'react';
-import { downloadCSVTemplate, parseCSV, createTradeRecord } from '../utils/tradeLogger.js';
+import { useState, useRef, useCallback, memo } from 'react';
+import { downloadCSVTemplate, parseCSV, createTradeRecords } from '../utils/tradeLogger.js';
+import { useLocalStorage } from '../hooks/useLocalStorage.js';
 
 const SL_OPTIONS = ['0.5', '1.0', '1.5', '2.0', '2.5', '3.0'];
 const LEV_OPTIONS = ['1', '2', '3', '5', '10', '20', '25', '50', '100'];
@@ -9,18 +10,32 @@ function todayStr() {
   return new Date().toISOString().slice(0, 10);
 }
 
+// A row becomes a trade only once entry, ATR and TP are all positive numbers
+function isValidRow(r) {
+  return parseFloat(r.entryPrice) > 0 && parseFloat(r.atr) > 0 && parseFloat(r.tpPrice) > 0;
+}
+
 let nextId = 1;
 function emptyRow() {
   return { id: nextId++, date: todayStr(), direction: 'LONG', entryPrice: '', atr: '', slMultiple: '1.0', tpPrice: '', leverage: '1', outcome: 'WIN' };
 }
 
-export default function BacktestBulkEntry({ startingCapital, onRunBacktest }) {
-  const [rows, setRows] = useState([emptyRow()]);
+// Restored rows keep their ids, so rows added afterwards must be numbered past them
+function reserveIds(rows) {
+  for (const r of rows) if (r.id >= nextId) nextId = r.id + 1;
+  return rows;
+}
+
+export default function BacktestBulkEntry({ storageKey, startingCapital, onRunBacktest }) {
+  const [initialRows] = useState(() => [emptyRow()]);
+  // Rows survive an accidental reload instead of having to be re-entered; saved once typing pauses
+  const [rows, setRows] = useLocalStorage(storageKey, initialRows, 400, reserveIds);
   const fileRef = useRef();
 
   function addRow() { setRows(prev => [...prev, emptyRow()]); }
-  function deleteRow(id) { setRows(prev => prev.length > 1 ? prev.filter(r => r.id !== id) : prev); }
-  function updateRow(id, field, val) { setRows(prev => prev.map(r => r.id === id ? { ...r, [field]: val } : r)); }
+  // Stable handlers so an edit re-renders only the row whose object changed
+  const deleteRow = useCallback(id => setRows(prev => prev.length > 1 ? prev.filter(r => r.id !== id) : prev), [setRows]);
+  const updateRow = useCallback((id, field, val) => setRows(prev => prev.map(r => r.id === id ? { ...r, [field]: val } : r)), [setRows]);
   function clearAll() { nextId = 1; setRows([emptyRow()]); }
 
   function handleCSV(e) {
@@ -35,30 +50,21 @@ export default function BacktestBulkEntry({ startingCapital, onRunBacktest }) {
     e.target.value = '';
   }
 
+  // Renders (every keystroke) only need the count; the filtered rows are built on submit
+  let validCount = 0;
+  for (const r of rows) if (isValidRow(r)) validCount++;
+
   function runBacktest() {
-    const validRows = rows.filter(r => r.entryPrice && r.atr && r.tpPrice &&
-      parseFloat(r.entryPrice) > 0 && parseFloat(r.atr) > 0 && parseFloat(r.tpPrice) > 0);
-    if (validRows.length === 0) return;
-    let capital = parseFloat(startingCapital) || 10000;
-    const trades = validRows.map((r, i) => {
-      const trade = createTradeRecord({ tradeNum: i + 1, date: r.date, direction: r.direction, entryPrice: r.entryPrice, atr: r.atr, slMultiple: r.slMultiple, tpPrice: r.tpPrice, leverage: r.leverage, capital, outcome: r.outcome });
-      capital = trade.capitalAfter;
-      return trade;
-    });
-    onRunBacktest(trades);
+    if (validCount === 0) return;
+    onRunBacktest(createTradeRecords(rows.filter(isValidRow), startingCapital));
   }
 
-  const validCount = rows.filter(r =>
-    r.entryPrice && r.atr && r.tpPrice &&
-    parseFloat(r.entryPrice) > 0 && parseFloat(r.atr) > 0 && parseFloat(r.tpPrice) > 0
-  ).length;
-
   const th = { padding: '0.5rem 0.625rem', color: '#444444', fontFamily: F, textTransform: 'uppercase', letterSpacing: '0.08em', fontSize: '0.75rem', textAlign: 'left', whiteSpace: 'nowrap', background: '#0d0d0d', borderBottom: '1px solid #2a2a2a' };
 
   return (
     <div className="terminal-panel">
       <div className="panel-header">
-        <span style={{ display: 'inline-block', width: 8, height: 8, background: '#FF6600' }} />
+        <span className="panel-marker" />
         BACKTEST BULK ENTRY
         <span style={{ marginLeft: 'auto', color: '#888888', fontFamily: F, fontSize: '0.875rem' }}>
           {rows.length} ROWS{validCount > 0 ? ` · ${validCount} VALID` : ''}
@@ -96,31 +102,7 @@ export default function BacktestBulkEntry({ startingCapital, onRunBacktest }) {
             </thead>
             <tbody>
               {rows.map((row, idx) => (
-                <tr key={row.id} style={{ borderBottom: '1px solid #1a1a1a' }}
-                  onMouseEnter={e => e.currentTarget.style.background = '#131313'}
-                  onMouseLeave={e => e.currentTarget.style.background = 'transparent'}>
-                  <td style={{ padding: '0.375rem 0.625rem', color: '#444444', fontSize: '0.875rem' }}>{idx + 1}</td>
-                  <td style={{ padding: '0.375rem 0.375rem' }}>
-                    <input type="date" value={row.date} onChange={e => updateRow(row.id, 'date', e.target.value)} style={{ ...cellInput, width: '130px', colorScheme: 'dark' }} />
-                  </td>
-                  <td style={{ padding: '0.375rem 0.375rem' }}>
-                    <select value={row.direction} onChange={e => updateRow(row.id, 'direction', e.target.value)}
-                      style={{ background: '#0a0a0a', border: '1px solid #2a2a2a', color: row.direction === 'LONG' ? '#00E676' : '#FF1744', fontFamily: F, fontSize: '0.875rem', fontWeight: 600, padding: '0.3rem 0.5rem', outline: 'none', width: '110px', cursor: 'pointer' }}>
-                      <option value="LONG">▲ LONG</option>
-                      <option value="SHORT">▼ SHORT</option>
-                    </select>
-                  </td>
-                  <td style={{ padding: '0.375rem 0.375rem' }}><input type="number" value={row.entryPrice} onChange={e => updateRow(row.id, 'entryPrice', e.target.value)} style={cellInput} placeholder="0.0000" step="0.0001" /></td>
-                  <td style={{ padding: '0.375rem 0.375rem' }}><input type="number" value={row.atr} onChange={e => updateRow(row.id, 'atr', e.target.value)} style={cellInput} placeholder="0.0000" step="0.0001" /></td>
-                  <td style={{ padding: '0.375rem 0.375rem' }}><select value={row.slMultiple} onChange={e => updateRow(row.id, 'slMultiple', e.target.value)} style={cellSelect}>{SL_OPTIONS.map(o => <option key={o} value={o}>{o}x</option>)}</select></td>
-                  <td style={{ padding: '0.375rem 0.375rem' }}><input type="number" value={row.tpPrice} onChange={e => updateRow(row.id, 'tpPrice', e.target.value)} style={{ ...cellInput, borderColor: row.tpPrice ? '#2a2a2a' : '#331a00' }} placeholder="0.0000" step="0.0001" /></td>
-                  <td style={{ padding: '0.375rem 0.375rem' }}><select value={row.leverage} onChange={e => updateRow(row.id, 'leverage', e.target.value)} style={cellSelect}>{LEV_OPTIONS.map(o => <option key={o} value={o}>{o}x</option>)}</select></td>
-                  <td style={{ padding: '0.375rem 0.375rem' }}><select value={row.outcome} onChange={e => updateRow(row.id, 'outcome', e.target.value)} style={{ ...cellSelect, color: row.outcome === 'WIN' ? '#00E676' : '#FF1744' }}><option value="WIN">WIN</option><option value="LOSS">LOSS</option></select></td>
-                  <td style={{ padding: '0.375rem 0.375rem' }}>
-                    <button onClick={() => deleteRow(row.id)} style={{ color: '#444444', background: 'none', border: 'none', cursor: 'pointer', width: '28px', height: '28px', display: 'flex', alignItems: 'center', justifyContent: 'center', fontSize: '1rem' }}
-                      onMouseEnter={e => e.currentTarget.style.color = '#FF1744'} onMouseLeave={e => e.currentTarget.style.color = '#444444'}>✕</button>
-                  </td>
-                </tr>
+                <MemoBulkRow key={row.id} row={row} idx={idx} onUpdate={updateRow} onDelete={deleteRow} />
               ))}
             </tbody>
           </table>
@@ -130,7 +112,7 @@ export default function BacktestBulkEntry({ startingCapital, onRunBacktest }) {
       {/* ── MOBILE CARDS (hidden on desktop) ── */}
       <div className="bulk-card-view">
         {rows.map((row, idx) => (
-          <TradeCard key={row.id} row={row} idx={idx} onUpdate={updateRow} onDelete={deleteRow} canDelete={rows.length > 1} />
+          <MemoTradeCard key={row.id} row={row} idx={idx} onUpdate={updateRow} onDelete={deleteRow} canDelete={rows.length > 1} />
         ))}
       </div>
 
@@ -146,9 +128,40 @@ export default function BacktestBulkEntry({ startingCapital, onRunBacktest }) {
   );
 }
 
+function BulkRow({ row, idx, onUpdate, onDelete }) {
+  return (
+    <tr style={{ borderBottom: '1px solid #1a1a1a' }}
+      onMouseEnter={e => e.currentTarget.style.background = '#131313'}
+      onMouseLeave={e => e.currentTarget.style.background = 'transparent'}>
+      <td style={{ padding: '0.375rem 0.625rem', color: '#444444', fontSize: '0.875rem' }}>{idx + 1}</td>
+      <td style={{ padding: '0.375rem 0.375rem' }}>
+        <input type="date" value={row.date} onChange={e => onUpdate(row.id, 'date', e.target.value)} style={{ ...cellInput, width: '130px', colorScheme: 'dark' }} />
+      </td>
+      <td style={{ padding: '0.375rem 0.375rem' }}>
+        <select value={row.direction} onChange={e => onUpdate(row.id, 'direction', e.target.value)}
+          style={{ background: '#0a0a0a', border: '1px solid #2a2a2a', color: row.direction === 'LONG' ? '#00E676' : '#FF1744', fontFamily: F, fontSize: '0.875rem', fontWeight: 600, padding: '0.3rem 0.5rem', outline: 'none', width: '110px', cursor: 'pointer' }}>
+          <option value="LONG">▲ LONG</option>
+          <option value="SHORT">▼ SHORT</option>
+        </select>
+      </td>
+      <td style={{ padding: '0.375rem 0.375rem' }}><input type="number" value={row.entryPrice} onChange={e => onUpdate(row.id, 'entryPrice', e.target.value)} style={cellInput} placeholder="0.0000" step="0.0001" /></td>
+      <td style={{ padding: '0.375rem 0.375rem' }}><input type="number" value={row.atr} onChange={e => onUpdate(row.id, 'atr', e.target.value)} style={cellInput} placeholder="0.0000" step="0.0001" /></td>
+      <td style={{ padding: '0.375rem 0.375rem' }}><select value={row.slMultiple} onChange={e => onUpdate(row.id, 'slMultiple', e.target.value)} style={cellSelect}>{SL_OPTIONS.map(o => <option key={o} value={o}>{o}x</option>)}</select></td>
+      <td style={{ padding: '0.375rem 0.375rem' }}><input type="number" value={row.tpPrice} onChange={e => onUpdate(row.id, 'tpPrice', e.target.value)} style={{ ...cellInput, borderColor: row.tpPrice ? '#2a2a2a' : '#331a00' }} placeholder="0.0000" step="0.0001" /></td>
+      <td style={{ padding: '0.375rem 0.375rem' }}><select value={row.leverage} onChange={e => onUpdate(row.id, 'leverage', e.target.value)} style={cellSelect}>{LEV_OPTIONS.map(o => <option key={o} value={o}>{o}x</option>)}</select></td>
+      <td style={{ padding: '0.375rem 0.375rem' }}><select value={row.outcome} onChange={e => onUpdate(row.id, 'outcome', e.target.value)} style={{ ...cellSelect, color: row.outcome === 'WIN' ? '#00E676' : '#FF1744' }}><option value="WIN">WIN</option><option value="LOSS">LOSS</option></select></td>
+      <td style={{ padding: '0.375rem 0.375rem' }}>
+        <button onClick={() => onDelete(row.id)} style={{ color: '#444444', background: 'none', border: 'none', cursor: 'pointer', width: '28px', height: '28px', display: 'flex', alignItems: 'center', justifyContent: 'center', fontSize: '1rem' }}
+          onMouseEnter={e => e.currentTarget.style.color = '#FF1744'} onMouseLeave={e => e.currentTarget.style.color = '#444444'}>✕</button>
+      </td>
+    </tr>
+  );
+}
+
+const MemoBulkRow = memo(BulkRow);
+
 function TradeCard({ row, idx, onUpdate, onDelete, canDelete }) {
-  const isValid = row.entryPrice && row.atr && row.tpPrice &&
-    parseFloat(row.entryPrice) > 0 && parseFloat(row.atr) > 0 && parseFloat(row.tpPrice) > 0;
+  const isValid = isValidRow(row);
 
   const cardInput = { background: '#0a0a0a', border: '1px solid #2a2a2a', color: '#E0E0E0', fontFamily: F, fontSize: '1rem', padding: '0.5rem 0.75rem', width: '100%', maxWidth: '100%', outline: 'none', minHeight: '44px', boxSizing: 'border-box' };
   const cardSelect = { ...cardInput, cursor: 'pointer', appearance: 'none' };
@@ -250,6 +263,8 @@ function TradeCard({ row, idx, onUpdate, onDelete, canDelete }) {
   );
 }
 
+const MemoTradeCard = memo(TradeCard);
+
 const cellInput = { background: '#0a0a0a', border: '1px solid #2a2a2a', color: '#E0E0E0', fontFamily: F, fontSize: '0.875rem', padding: '0.3rem 0.5rem', outline: 'none', width: '108px' };
 const cellSelect = { background: '#0a0a0a', border: '1px solid #2a2a2a', color: '#E0E0E0', fontFamily: F, fontSize: '0.875rem', padding: '0.3rem 0.5rem', outline: 'none', width: '80px', cursor: 'pointer' };
 const actionBtnStyle = { background: 'transparent', color: '#FF6600', fontFamily: F, fontWeight: 600, fontSize: '0.875rem', padding: '0.4rem 0.875rem', border: '1px solid #FF6600', textTransform: 'uppercase', letterSpacing: '0.08em', cursor: 'pointer', display: 'inline-flex', alignItems: 'center', justifyContent: 'center' };
@@ -1,6 +1,8 @@
+import { memo, useMemo } from 'react';
 import {
   PieChart, Pie, Cell, BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer
 } from 'recharts';
+import { RESIZE_DEBOUNCE_MS } from './chartConfig.js';
 
 const tooltipStyle = {
   contentStyle: {
@@ -13,52 +15,44 @@ const tooltipStyle = {
   itemStyle: { color: '#E0E0E0' },
 };
 
-function axisProps() {
-  return {
-    tick: { fill: '#888888', fontFamily: "Helvetica, Arial, sans-serif", fontSize: 10 },
-    axisLine: { stroke: '#2a2a2a' },
-    tickLine: false,
-  };
-}
+const axisProps = {
+  tick: { fill: '#888888', fontFamily: "Helvetica, Arial, sans-serif", fontSize: 10 },
+  axisLine: { stroke: '#2a2a2a' },
+  tickLine: false,
+};
 
-export default function DistributionCharts({ trades, id = 'distribution-charts' }) {
-  const wins = trades.filter(t => t.outcome === 'WIN').length;
-  const losses = trades.filter(t => t.outcome === 'LOSS').length;
+const barMargin = { top: 5, right: 8, left: 0, bottom: 5 };
 
-  const pieData = [
-    { name: 'WIN', value: wins, fill: '#00E676' },
-    { name: 'LOSS', value: losses, fill: '#FF1744' },
-  ];
+function pieLabel({ name, percent, value }) {
+  return value > 0 ? `${name} ${(percent * 100).toFixed(0)}%` : '';
+}
 
-  // Direction breakdown
-  const dirData = [
-    { name: 'L-WIN', value: trades.filter(t => t.direction === 'LONG' && t.outcome === 'WIN').reduce((s, t) => s + t.pnl, 0), fill: '#00E676' },
-    { name: 'L-LOSS', value: trades.filter(t => t.direction === 'LONG' && t.outcome === 'LOSS').reduce((s, t) => s + t.pnl, 0), fill: '#FF1744' },
-    { name: 'S-WIN', value: trades.filter(t => t.direction === 'SHORT' && t.outcome === 'WIN').reduce((s, t) => s + t.pnl, 0), fill: '#00A0FF' },
-    { name: 'S-LOSS', value: trades.filter(t => t.direction === 'SHORT' && t.outcome === 'LOSS').reduce((s, t) => s + t.pnl, 0), fill: '#FF8800' },
-  ].filter(d => d.value !== 0);
+function pieTooltip(v, n) {
+  return [v, n];
+}
 
-  const slData = groupNetPnL(trades, 'slMultiple');
-  const tpData = groupNetPnL(trades, 'tpMultiple');
-  const levData = groupNetPnL(trades, 'leverage');
+// wins/losses come from the report stats, which have already counted outcomes
+function DistributionCharts({ trades, wins, losses, id = 'distribution-charts' }) {
+  const { pieData, dirData, slData, tpData, levData } = useMemo(() => chartData(trades, wins, losses), [trades, wins, losses]);
 
   return (
     <div id={id} style={{ display: 'grid', gridTemplateColumns: 'repeat(auto-fit, minmax(280px, 1fr))', gap: '1rem' }}>
 
       <ChartPanel title="WIN / LOSS DISTRIBUTION" id="pdf-chart-0">
-        <ResponsiveContainer width="100%" height={210}>
+        <ResponsiveContainer width="100%" height={210} debounce={RESIZE_DEBOUNCE_MS}>
           <PieChart>
             <Pie
               data={pieData}
               cx="50%" cy="50%"
               outerRadius={75}
               dataKey="value"
-              label={({ name, percent, value }) => value > 0 ? `${name} ${(percent * 100).toFixed(0)}%` : ''}
+              label={pieLabel}
               labelLine={false}
+              isAnimationActive={false}
             >
               {pieData.map((entry, i) => <Cell key={i} fill={entry.fill} />)}
             </Pie>
-            <Tooltip {...tooltipStyle} formatter={(v, n) => [v, n]} />
+            <Tooltip {...tooltipStyle} formatter={pieTooltip} />
           </PieChart>
         </ResponsiveContainer>
       </ChartPanel>
@@ -83,11 +77,42 @@ export default function DistributionCharts({ trades, id = 'distribution-charts'
   );
 }
 
+// Recharts re-lays out every series on render; skip it unless the trades actually changed
+export default memo(DistributionCharts);
+
+function chartData(trades, wins, losses) {
+  // Direction × outcome P&L buckets in one pass
+  const dirPnL = { LONG: { WIN: 0, LOSS: 0 }, SHORT: { WIN: 0, LOSS: 0 } };
+  for (const t of trades) {
+    const bucket = dirPnL[t.direction];
+    if (bucket && bucket[t.outcome] !== undefined) bucket[t.outcome] += t.pnl;
+  }
+
+  const pieData = [
+    { name: 'WIN', value: wins, fill: '#00E676' },
+    { name: 'LOSS', value: losses, fill: '#FF1744' },
+  ];
+
+  // Direction breakdown
+  const dirData = [
+    { name: 'L-WIN', value: dirPnL.LONG.WIN, fill: '#00E676' },
+    { name: 'L-LOSS', value: dirPnL.LONG.LOSS, fill: '#FF1744' },
+    { name: 'S-WIN', value: dirPnL.SHORT.WIN, fill: '#00A0FF' },
+    { name: 'S-LOSS', value: dirPnL.SHORT.LOSS, fill: '#FF8800' },
+  ].filter(d => d.value !== 0);
+
+  const slData = groupNetPnL(trades, 'slMultiple');
+  const tpData = groupNetPnL(trades, 'tpMultiple');
+  const levData = groupNetPnL(trades, 'leverage');
+
+  return { pieData, dirData, slData, tpData, levData };
+}
+
 function ChartPanel({ title, children, id }) {
   return (
     <div className="terminal-panel" id={id}>
       <div className="panel-header" style={{ fontSize: '0.65rem' }}>
-        <span style={{ display: 'inline-block', width: 6, height: 6, background: '#FF6600' }}></span>
+        <span className="panel-marker panel-marker-sm" />
         {title}
       </div>
       <div style={{ padding: '0.75rem' }}>{children}</div>
@@ -100,16 +125,16 @@ function BarGroupChart({ data, suffix, isDollar }) {
     return <div style={{ height: 210, display: 'flex', alignItems: 'center', justifyContent: 'center', color: '#444444', fontFamily: "Helvetica, Arial, sans-serif", fontSize: '1.0625rem' }}>NO DATA</div>;
   }
   return (
-    <ResponsiveContainer width="100%" height={210}>
-      <BarChart data={data} margin={{ top: 5, right: 8, left: 0, bottom: 5 }}>
+    <ResponsiveContainer width="100%" height={210} debounce={RESIZE_DEBOUNCE_MS}>
+      <BarChart data={data} margin={barMargin}>
         <CartesianGrid strokeDasharray="2 4" stroke="#1a1a1a" />
         <XAxis
           dataKey="name"
-          {...axisProps()}
+          {...axisProps}
           tickFormatter={v => `${v}${suffix}`}
         />
         <YAxis
-          {...axisProps()}
+          {...axisProps}
           tickFormatter={v => isDollar ? (Math.abs(v) >= 1000 ? `$${(v/1000).toFixed(1)}k` : `$${v.toFixed(0)}`) : v}
           width={52}
         />
@@ -118,7 +143,7 @@ function BarGroupChart({ data, suffix, isDollar }) {
           formatter={v => [isDollar ? (v >= 0 ? '+$' + v.toFixed(2) : '-$' + Math.abs(v).toFixed(2)) : v, 'Net P&L']}
           labelFormatter={v => `${v}${suffix}`}
         />
-        <Bar dataKey="value" radius={0}>
+        <Bar dataKey="value" radius={0} isAnimationActive={false}>
           {data.map((entry, i) => <Cell key={i} fill={entry.value >= 0 ? '#00E676' : '#FF1744'} fillOpacity={0.85} />)}
         </Bar>
       </BarChart>
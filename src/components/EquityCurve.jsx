@@ -1,7 +1,25 @@
+import { memo, useMemo } from 'react';
 import {
   LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ReferenceLine, ResponsiveContainer,
 } from 'recharts';
 import { fmtDollar } from '../utils/formatters.js';
+import { RESIZE_DEBOUNCE_MS } from './chartConfig.js';
+
+// Static chart props live at module scope so every render hands Recharts the same objects
+const CHART_MARGIN = { top: 8, right: 16, left: 0, bottom: 16 };
+const AXIS_TICK = { fill: '#888888', fontFamily: "Helvetica, Arial, sans-serif", fontSize: 10 };
+const AXIS_LINE = { stroke: '#2a2a2a' };
+const X_LABEL = { value: 'TRADE #', position: 'insideBottom', offset: -8, fill: '#444444', fontSize: 9, fontFamily: "Helvetica, Arial, sans-serif" };
+const START_LABEL = { value: 'START', fill: '#FF6600', fontSize: 8, fontFamily: "Helvetica, Arial, sans-serif", position: 'insideTopRight' };
+const ACTIVE_DOT = { r: 6, fill: '#FF6600', stroke: '#0a0a0a', strokeWidth: 2 };
+// Numeric x so thinned points sit at their trade number rather than at evenly spaced slots
+const X_DOMAIN = ['dataMin', 'dataMax'];
+
+function fmtAxisDollar(v) {
+  if (v >= 1000000) return `$${(v / 1000000).toFixed(1)}M`;
+  if (v >= 1000) return `$${(v / 1000).toFixed(1)}k`;
+  return `$${v.toFixed(0)}`;
+}
 
 function CustomDot(props) {
   const { cx, cy, payload } = props;
@@ -31,25 +49,62 @@ function CustomTooltip({ active, payload }) {
   );
 }
 
-export default function EquityCurve({ trades, startingCapital, id = 'equity-curve' }) {
-  const data = [
-    { trade: 0, capital: startingCapital, outcome: null },
-    ...trades.map((t, i) => ({
-      trade: i + 1,
-      capital: t.capitalAfter,
-      outcome: t.outcome,
-      pnl: t.pnl,
-      direction: t.direction,
-    })),
-  ];
+// Recharts clones these per point/hover; one element instance is enough
+const DOT = <CustomDot />;
+const TOOLTIP = <CustomTooltip />;
+
+// A 300px-tall panel can't show more than this many distinct points, and per-trade dots
+// merge into a solid band well before that
+const MAX_POINTS = 1000;
+const MAX_DOTS = 200;
+
+// Keeps the lowest and highest point of each bucket, in trade order, so drawdowns and
+// new highs survive the thinning; the first and last points are always kept
+function decimate(points, maxPoints) {
+  const n = points.length;
+  if (n <= maxPoints) return points;
+  const buckets = Math.floor((maxPoints - 2) / 2);
+  const size = (n - 2) / buckets;
+  const out = [points[0]];
+  for (let b = 0; b < buckets; b++) {
+    const from = 1 + Math.floor(b * size);
+    const to = 1 + Math.floor((b + 1) * size);
+    let lo = from, hi = from;
+    for (let i = from + 1; i < to; i++) {
+      if (points[i].capital < points[lo].capital) lo = i;
+      if (points[i].capital > points[hi].capital) hi = i;
+    }
+    if (lo === hi) out.push(points[lo]);
+    else if (lo < hi) out.push(points[lo], points[hi]);
+    else out.push(points[hi], points[lo]);
+  }
+  out.push(points[n - 1]);
+  return out;
+}
+
+function EquityCurve({ trades, startingCapital, id = 'equity-curve' }) {
+  // Points and the y-range in one pass; spreading into Math.min/max also overflows the stack on huge logs
+  const { data, minCapital, maxCapital } = useMemo(() => {
+    const n = trades.length;
+    const points = new Array(n + 1);
+    points[0] = { trade: 0, capital: startingCapital, outcome: null };
+    let lo = startingCapital, hi = lo;
+    for (let i = 0; i < n; i++) {
+      const t = trades[i];
+      const capital = t.capitalAfter;
+      if (capital < lo) lo = capital;
+      if (capital > hi) hi = capital;
+      points[i + 1] = { trade: i + 1, capital, outcome: t.outcome, pnl: t.pnl, direction: t.direction };
+    }
+    return { data: decimate(points, MAX_POINTS), minCapital: lo, maxCapital: hi };
+  }, [trades, startingCapital]);
 
   const finalCapital = trades.length > 0 ? trades[trades.length - 1].capitalAfter : startingCapital;
   const isPositive = finalCapital >= startingCapital;
   const lineColor = isPositive ? '#00E676' : '#FF1744';
 
-  const allCapitals = data.map(d => d.capital);
-  const minVal = Math.min(...allCapitals) * 0.994;
-  const maxVal = Math.max(...allCapitals) * 1.006;
+  const minVal = minCapital * 0.994;
+  const maxVal = maxCapital * 1.006;
 
   const pnlDiff = finalCapital - startingCapital;
   const pnlPct = startingCapital > 0 ? (pnlDiff / startingCapital * 100).toFixed(2) : '0.00';
@@ -57,50 +112,49 @@ export default function EquityCurve({ trades, startingCapital, id = 'equity-curv
   return (
     <div className="terminal-panel" id={id}>
       <div className="panel-header">
-        <span style={{ display: 'inline-block', width: 8, height: 8, background: '#FF6600' }}></span>
+        <span className="panel-marker" />
         EQUITY CURVE
         <span style={{ marginLeft: 'auto', fontFamily: "Helvetica, Arial, sans-serif", fontSize: '1.0625rem', color: lineColor }}>
           {isPositive ? '▲' : '▼'} {(pnlDiff >= 0 ? '+' : '') + fmtDollar(pnlDiff)} ({isPositive ? '+' : ''}{pnlPct}%)
         </span>
       </div>
       <div style={{ padding: '1rem' }}>
-        <ResponsiveContainer width="100%" height={300}>
-          <LineChart data={data} margin={{ top: 8, right: 16, left: 0, bottom: 16 }}>
+        <ResponsiveContainer width="100%" height={300} debounce={RESIZE_DEBOUNCE_MS}>
+          <LineChart data={data} margin={CHART_MARGIN}>
             <CartesianGrid strokeDasharray="2 5" stroke="#1a1a1a" />
             <XAxis
               dataKey="trade"
-              tick={{ fill: '#888888', fontFamily: "Helvetica, Arial, sans-serif", fontSize: 10 }}
-              axisLine={{ stroke: '#2a2a2a' }}
+              type="number"
+              domain={X_DOMAIN}
+              tick={AXIS_TICK}
+              axisLine={AXIS_LINE}
               tickLine={false}
-              label={{ value: 'TRADE #', position: 'insideBottom', offset: -8, fill: '#444444', fontSize: 9, fontFamily: "Helvetica, Arial, sans-serif" }}
+              label={X_LABEL}
             />
             <YAxis
               domain={[minVal, maxVal]}
-              tick={{ fill: '#888888', fontFamily: "Helvetica, Arial, sans-serif", fontSize: 10 }}
-              axisLine={{ stroke: '#2a2a2a' }}
+              tick={AXIS_TICK}
+              axisLine={AXIS_LINE}
               tickLine={false}
-              tickFormatter={v => {
-                if (v >= 1000000) return `$${(v / 1000000).toFixed(1)}M`;
-                if (v >= 1000) return `$${(v / 1000).toFixed(1)}k`;
-                return `$${v.toFixed(0)}`;
-              }}
+              tickFormatter={fmtAxisDollar}
               width={58}
             />
-            <Tooltip content={<CustomTooltip />} />
+            <Tooltip content={TOOLTIP} />
             <ReferenceLine
               y={startingCapital}
               stroke="#FF6600"
               strokeDasharray="5 4"
               strokeOpacity={0.5}
-              label={{ value: 'START', fill: '#FF6600', fontSize: 8, fontFamily: "Helvetica, Arial, sans-serif", position: 'insideTopRight' }}
+              label={START_LABEL}
             />
             <Line
               type="monotone"
               dataKey="capital"
               stroke={lineColor}
               strokeWidth={2}
-              dot={<CustomDot />}
-              activeDot={{ r: 6, fill: '#FF6600', stroke: '#0a0a0a', strokeWidth: 2 }}
+              dot={data.length <= MAX_DOTS ? DOT : false}
+              activeDot={ACTIVE_DOT}
+              isAnimationActive={false}
             />
           </LineChart>
         </ResponsiveContainer>
@@ -108,3 +162,5 @@ export default function EquityCurve({ trades, startingCapital, id = 'equity-curv
     </div>
   );
 }
+
+export default memo(EquityCurve);
@@ -1,23 +1,32 @@
+import { memo, useMemo } from 'react';
 import { fmtPrice, fmtDollar, fmtPct, fmtRR } from '../utils/formatters.js';
 import { calcTrade } from '../utils/calculations.js';
+import { MetricSection, MetricRow } from './MetricList.jsx';
 
-export default function LiveCalculationsPanel({ tradeValues, capital }) {
-  const calc = calcTrade({
-    direction: tradeValues.direction || 'LONG',
-    entryPrice: tradeValues.entryPrice || 0,
-    atr: tradeValues.atr || 0,
-    slMultiple: tradeValues.slMultiple || 1,
-    tpPrice: tradeValues.tpPrice || 0,
-    leverage: tradeValues.leverage || 1,
-    capital,
-  });
+function LiveCalculationsPanel({ tradeValues, capital }) {
+  const { direction, entryPrice, atr, slMultiple, tpPrice, leverage } = tradeValues;
 
-  const ready = parseFloat(tradeValues.entryPrice) > 0 && parseFloat(tradeValues.atr) > 0 && parseFloat(tradeValues.tpPrice) > 0;
+  // Keyed on the individual inputs, so a new values object with the same fields reuses the result.
+  // Nothing is shown until entry, ATR and TP are all positive, so skip the maths until then.
+  const calc = useMemo(() => {
+    if (!(parseFloat(entryPrice) > 0 && parseFloat(atr) > 0 && parseFloat(tpPrice) > 0)) return null;
+    return calcTrade({
+      direction: direction || 'LONG',
+      entryPrice,
+      atr,
+      slMultiple: slMultiple || 1,
+      tpPrice,
+      leverage: leverage || 1,
+      capital,
+    });
+  }, [direction, entryPrice, atr, slMultiple, tpPrice, leverage, capital]);
+
+  const ready = calc !== null;
 
   return (
     <div className="terminal-panel" style={{ height: '100%', display: 'flex', flexDirection: 'column' }}>
       <div className="panel-header">
-        <span style={{ display: 'inline-block', width: 8, height: 8, background: '#FF6600' }}></span>
+        <span className="panel-marker" />
         LIVE CALCULATIONS
         <span style={{ marginLeft: 'auto', fontFamily: "Helvetica, Arial, sans-serif", fontSize: '1.0625rem' }}>
           {ready
@@ -29,24 +38,24 @@ export default function LiveCalculationsPanel({ tradeValues, capital }) {
 
       <div style={{ flex: 1, padding: '1rem', overflowY: 'auto' }}>
 
-        <MetricSection label="PRICES">
+        <MetricSection compact label="PRICES">
           <MetricRow label="Stop Loss Price" value={ready ? fmtPrice(calc.slPrice) : '—'} color="#FF1744" />
           <MetricRow label="Take Profit Price" value={ready ? fmtPrice(calc.tpPrice) : '—'} color="#00E676" />
         </MetricSection>
 
-        <MetricSection label="DISTANCES">
+        <MetricSection compact label="DISTANCES">
           <MetricRow label="SL Distance" value={ready ? `${fmtPrice(calc.slDist)} (${fmtPct(calc.slPct)})` : '—'} color="#FF1744" />
           <MetricRow label="TP Distance" value={ready ? `${fmtPrice(calc.tpDist)} (${fmtPct(calc.tpPct)})` : '—'} color="#00E676" />
           <MetricRow label="Risk / Reward" value={ready ? fmtRR(calc.rr) : '—'} color="#FF6600" />
         </MetricSection>
 
-        <MetricSection label="POSITION SIZE">
+        <MetricSection compact label="POSITION SIZE">
           <MetricRow label="Effective Size" value={ready ? fmtDollar(calc.positionSize) : '—'} />
           <MetricRow label="Capital at Risk" value={ready ? fmtDollar(calc.capitalAtRisk) : '—'} color="#FFD600" />
           <MetricRow label="Current Capital" value={fmtDollar(capital)} color="#FF6600" />
         </MetricSection>
 
-        <MetricSection label="OUTCOME SCENARIOS">
+        <MetricSection compact label="OUTCOME SCENARIOS">
           <MetricRow label="Max Loss (SL Hit)" value={ready ? `${fmtDollar(calc.maxLoss)} (${fmtPct(calc.maxLossPct)})` : '—'} color="#FF1744" />
           <MetricRow label="Max Gain (TP Hit)" value={ready ? `${fmtDollar(calc.maxGain)} (${fmtPct(calc.maxGainPct)})` : '—'} color="#00E676" />
         </MetricSection>
@@ -57,24 +66,4 @@ export default function LiveCalculationsPanel({ tradeValues, capital }) {
   );
 }
 
-function MetricSection({ label, children }) {
-  return (
-    <div style={{ marginBottom: '0.875rem' }}>
-      <div style={{ color: '#444444', fontFamily: "Helvetica, Arial, sans-serif", fontSize: '0.6rem', textTransform: 'uppercase', letterSpacing: '0.2em', marginBottom: '0.25rem', paddingLeft: '0.25rem' }}>
-        {label}
-      </div>
-      <div style={{ background: '#0d0d0d', border: '1px solid #1a1a1a' }}>
-        {children}
-      </div>
-    </div>
-  );
-}
-
-function MetricRow({ label, value, color = '#E0E0E0' }) {
-  return (
-    <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center', padding: '0.375rem 0.75rem', borderBottom: '1px solid #1a1a1a' }}>
-      <span style={{ color: '#888888', fontFamily: "Helvetica, Arial, sans-serif", fontSize: '1.0625rem' }}>{label}</span>
-      <span style={{ color, fontFamily: "Helvetica, Arial, sans-serif", fontSize: '1.0625rem', fontWeight: 500, fontVariantNumeric: 'tabular-nums' }}>{value}</span>
-    </div>
-  );
-}
+export default memo(LiveCalculationsPanel);
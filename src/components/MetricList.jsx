@@ -0,0 +1,31 @@
+// Labelled metric sections shared by the live calculations panel and the report summary.
+// Row and section chrome is identical for every metric; only the value colour varies.
+const SECTION_STYLE = { marginBottom: '1rem' };
+const SECTION_STYLE_COMPACT = { marginBottom: '0.875rem' };
+const SECTION_LABEL_STYLE = { color: '#444444', fontFamily: "Helvetica, Arial, sans-serif", fontSize: '0.6rem', textTransform: 'uppercase', letterSpacing: '0.2em', marginBottom: '0.25rem', paddingLeft: '0.25rem' };
+const SECTION_BODY_STYLE = { background: '#0d0d0d', border: '1px solid #1a1a1a' };
+const ROW_STYLE = { display: 'flex', justifyContent: 'space-between', alignItems: 'center', padding: '0.375rem 0.75rem', borderBottom: '1px solid #1a1a1a' };
+const ROW_LABEL_STYLE = { color: '#888888', fontFamily: "Helvetica, Arial, sans-serif", fontSize: '1.0625rem' };
+const ROW_VALUE_STYLE = { fontFamily: "Helvetica, Arial, sans-serif", fontSize: '1.0625rem', fontWeight: 500, fontVariantNumeric: 'tabular-nums' };
+
+export function MetricSection({ label, compact = false, children }) {
+  return (
+    <div style={compact ? SECTION_STYLE_COMPACT : SECTION_STYLE}>
+      <div style={SECTION_LABEL_STYLE}>
+        {label}
+      </div>
+      <div style={SECTION_BODY_STYLE}>
+        {children}
+      </div>
+    </div>
+  );
+}
+
+export function MetricRow({ label, value, color = '#E0E0E0' }) {
+  return (
+    <div style={ROW_STYLE}>
+      <span style={ROW_LABEL_STYLE}>{label}</span>
+      <span style={{ ...ROW_VALUE_STYLE, color }}>{value}</span>
+    </div>
+  );
+}
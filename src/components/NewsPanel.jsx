@@ -40,7 +40,7 @@ export default function NewsPanel() {
   return (
     <div className="terminal-panel" style={{ display: 'flex', flexDirection: 'column', height: '100%' }}>
       <div className="panel-header">
-        <span style={{ display: 'inline-block', width: 8, height: 8, background: '#FF6600' }} />
+        <span className="panel-marker" />
         MARKET NEWS
         <span style={{ marginLeft: 'auto', color: '#00E676', fontFamily: F, fontSize: '0.75rem', display: 'flex', alignItems: 'center', gap: '0.25rem' }}>
           <span style={{ display: 'inline-block', width: 6, height: 6, borderRadius: '50%', background: '#00E676' }} />
@@ -41,7 +41,7 @@ export default function SessionInit({ onInit }) {
         {/* Panel */}
         <div className="terminal-panel">
           <div className="panel-header">
-            <span style={{ display: 'inline-block', width: 8, height: 8, background: '#FF6600' }}></span>
+            <span className="panel-marker" />
             SESSION INITIALISATION
           </div>
 
@@ -130,10 +130,6 @@ export default function SessionInit({ onInit }) {
       <div style={{ width: '360px', flexShrink: 0, height: 'calc(100vh - 2rem)', position: 'sticky', top: '1rem', display: 'none' }} className="news-sidebar">
         <NewsPanel />
       </div>
-
-      <style>{`
-        @media (min-width: 900px) { .news-sidebar { display: flex !important; flex-direction: column; } }
-      `}</style>
     </div>
   );
 }
@@ -31,7 +31,7 @@ export default function TradeEntryPanel({ values, onChange }) {
   return (
     <div className="terminal-panel" style={{ height: '100%' }}>
       <div className="panel-header">
-        <span style={{ display: 'inline-block', width: 8, height: 8, background: '#FF6600' }} />
+        <span className="panel-marker" />
         TRADE ENTRY
       </div>
 
@@ -53,29 +53,13 @@ export default function TradeEntryPanel({ values, onChange }) {
         <StepperField label="ATR (14)" value={values.atr || ''} onChange={v => onChange('atr', v)} onStep={d => step('atr', d, 4)} stepSize={0.0001} placeholder="0.0000" />
 
         {/* SL Multiple */}
-        <div style={{ marginBottom: '1rem' }}>
-          <label className="terminal-label" style={{ display: 'block', marginBottom: '0.375rem' }}>SL Multiple</label>
-          <div style={{ position: 'relative' }}>
-            <select value={values.slMultiple || savedSL} onChange={e => handleChange('slMultiple', e.target.value)} className="terminal-select">
-              {SL_OPTIONS.map(o => <option key={o} value={o}>{o}x ATR</option>)}
-            </select>
-            <div style={{ position: 'absolute', right: '0.75rem', top: '50%', transform: 'translateY(-50%)', color: '#FF6600', fontSize: '0.75rem', pointerEvents: 'none' }}>▼</div>
-          </div>
-        </div>
+        <SelectField label="SL Multiple" value={values.slMultiple || savedSL} onChange={v => handleChange('slMultiple', v)} options={SL_OPTIONS} suffix="x ATR" />
 
         {/* TP Price (direct input) */}
         <StepperField label="Take Profit Price" value={values.tpPrice || ''} onChange={v => onChange('tpPrice', v)} onStep={d => step('tpPrice', d, 4)} stepSize={0.0001} placeholder="0.0000" />
 
         {/* Leverage */}
-        <div style={{ marginBottom: '0.5rem' }}>
-          <label className="terminal-label" style={{ display: 'block', marginBottom: '0.375rem' }}>Leverage</label>
-          <div style={{ position: 'relative' }}>
-            <select value={values.leverage || savedLev} onChange={e => handleChange('leverage', e.target.value)} className="terminal-select">
-              {LEV_OPTIONS.map(o => <option key={o} value={o}>{o}x</option>)}
-            </select>
-            <div style={{ position: 'absolute', right: '0.75rem', top: '50%', transform: 'translateY(-50%)', color: '#FF6600', fontSize: '0.75rem', pointerEvents: 'none' }}>▼</div>
-          </div>
-        </div>
+        <SelectField label="Leverage" value={values.leverage || savedLev} onChange={v => handleChange('leverage', v)} options={LEV_OPTIONS} suffix="x" marginBottom="0.5rem" />
 
       </div>
     </div>
@@ -126,3 +110,19 @@ function StepperField({ label, value, onChange, onStep, stepSize, placeholder })
     </div>
   );
 }
+
+const SELECT_CARET = { position: 'absolute', right: '0.75rem', top: '50%', transform: 'translateY(-50%)', color: '#FF6600', fontSize: '0.75rem', pointerEvents: 'none' };
+
+function SelectField({ label, value, onChange, options, suffix, marginBottom = '1rem' }) {
+  return (
+    <div style={{ marginBottom }}>
+      <label className="terminal-label" style={{ display: 'block', marginBottom: '0.375rem' }}>{label}</label>
+      <div style={{ position: 'relative' }}>
+        <select value={value} onChange={e => onChange(e.target.value)} className="terminal-select">
+          {options.map(o => <option key={o} value={o}>{o}{suffix}</option>)}
+        </select>
+        <div style={SELECT_CARET}>▼</div>
+      </div>
+    </div>
+  );
+}
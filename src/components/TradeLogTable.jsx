@@ -1,5 +1,5 @@
-import { useState } from 'react';
-import { fmtDollar, fmtTimestamp, fmtPrice } from '../utils/formatters.js';
+import { useState, useMemo } from 'react';
+import { fmtDollar, fmtTimestamp } from '../utils/formatters.js';
 
 const COLS = [
   { key: 'tradeNum', label: '#' },
@@ -12,15 +12,32 @@ const COLS = [
   { key: 'capitalAfter', label: 'CAPITAL' },
 ];
 
+// Long report logs show this many rows from each end of the sort order until expanded
+const EDGE_ROWS = 100;
+
 export default function TradeLogTable({ trades, maxRows = 5, showAll = false }) {
   const [sortKey, setSortKey] = useState('tradeNum');
   const [sortDir, setSortDir] = useState('desc');
+  const [expanded, setExpanded] = useState(false);
+
+  // Only re-sort when the log or the sort order changes, not on every parent render
+  const sorted = useMemo(() => {
+    if (!trades || trades.length === 0) return [];
+    if (!showAll) return trades.slice(-maxRows).reverse();
+    // Trades are logged in tradeNum order, so the default sort needs no comparator pass
+    if (sortKey === 'tradeNum') return sortDir === 'asc' ? trades : trades.slice().reverse();
+    return trades.slice().sort((a, b) => {
+      const av = a[sortKey], bv = b[sortKey];
+      if (sortDir === 'asc') return av > bv ? 1 : -1;
+      return av < bv ? 1 : -1;
+    });
+  }, [trades, showAll, maxRows, sortKey, sortDir]);
 
   if (!trades || trades.length === 0) {
     return (
       <div className="terminal-panel">
         <div className="panel-header">
-          <span style={{ display: 'inline-block', width: 8, height: 8, background: '#FF6600' }}></span>
+          <span className="panel-marker" />
           TRADE LOG
           <span style={{ marginLeft: 'auto', color: '#444444' }}>NO TRADES</span>
         </div>
@@ -36,21 +53,14 @@ export default function TradeLogTable({ trades, maxRows = 5, showAll = false })
     else { setSortKey(key); setSortDir('desc'); }
   }
 
-  let sorted = [...trades];
-  if (showAll) {
-    sorted.sort((a, b) => {
-      const av = a[sortKey], bv = b[sortKey];
-      if (sortDir === 'asc') return av > bv ? 1 : -1;
-      return av < bv ? 1 : -1;
-    });
-  } else {
-    sorted = sorted.slice(-maxRows).reverse();
-  }
+  const hidden = showAll && !expanded ? Math.max(0, sorted.length - EDGE_ROWS * 2) : 0;
+  const head = hidden > 0 ? sorted.slice(0, EDGE_ROWS) : sorted;
+  const tail = hidden > 0 ? sorted.slice(-EDGE_ROWS) : [];
 
   return (
     <div className="terminal-panel">
       <div className="panel-header">
-        <span style={{ display: 'inline-block', width: 8, height: 8, background: '#FF6600' }}></span>
+        <span className="panel-marker" />
         TRADE LOG
         {showAll && <span style={{ marginLeft: '0.5rem', color: '#444444', fontSize: '1.0625rem' }}>CLICK HEADERS TO SORT</span>}
         <span style={{ marginLeft: 'auto', color: '#888888', fontFamily: "Helvetica, Arial, sans-serif", fontSize: '1.0625rem' }}>{trades.length} TOTAL</span>
@@ -81,44 +91,65 @@ export default function TradeLogTable({ trades, maxRows = 5, showAll = false })
             </tr>
           </thead>
           <tbody>
-            {sorted.map(t => (
-              <tr
-                key={t.tradeNum}
-                style={{
-                  borderBottom: '1px solid #1a1a1a',
-                  background: t.outcome === 'WIN' ? 'rgba(0,230,118,0.03)' : 'rgba(255,23,68,0.03)',
-                }}
-              >
-                <td style={{ padding: '0.5rem 0.75rem', color: '#444444' }}>{t.tradeNum}</td>
-                <td style={{ padding: '0.5rem 0.75rem', color: '#888888', whiteSpace: 'nowrap' }}>{fmtTimestamp(t.timestamp)}</td>
-                <td style={{ padding: '0.5rem 0.75rem', color: t.direction === 'LONG' ? '#00E676' : '#FF1744' }}>
-                  {t.direction === 'LONG' ? '▲' : '▼'} {t.direction}
-                </td>
-                <td style={{ padding: '0.5rem 0.75rem', color: '#E0E0E0', fontVariantNumeric: 'tabular-nums' }}>{t.entryPrice?.toFixed(4)}</td>
-                <td style={{ padding: '0.5rem 0.75rem', color: '#FFB300', fontVariantNumeric: 'tabular-nums' }}>1:{t.rr?.toFixed(2)}</td>
-                <td style={{ padding: '0.5rem 0.75rem' }}>
-                  <span style={{
-                    padding: '0.125rem 0.5rem',
-                    fontSize: '1.0625rem',
-                    textTransform: 'uppercase',
-                    background: t.outcome === 'WIN' ? 'rgba(0,230,118,0.1)' : 'rgba(255,23,68,0.1)',
-                    color: t.outcome === 'WIN' ? '#00E676' : '#FF1744',
-                    border: `1px solid ${t.outcome === 'WIN' ? 'rgba(0,230,118,0.3)' : 'rgba(255,23,68,0.3)'}`,
-                  }}>
-                    {t.outcome}
-                  </span>
-                </td>
-                <td style={{ padding: '0.5rem 0.75rem', textAlign: 'right', fontVariantNumeric: 'tabular-nums', fontWeight: 500, color: t.pnl >= 0 ? '#00E676' : '#FF1744' }}>
-                  {t.pnl >= 0 ? '+' : ''}{fmtDollar(t.pnl)}
-                </td>
-                <td style={{ padding: '0.5rem 0.75rem', textAlign: 'right', color: '#E0E0E0', fontVariantNumeric: 'tabular-nums' }}>
-                  {fmtDollar(t.capitalAfter)}
+            {head.map(t => <TradeRow key={t.tradeNum} t={t} />)}
+            {hidden > 0 && (
+              <tr style={{ borderBottom: '1px solid #1a1a1a' }}>
+                <td colSpan={COLS.length} style={{ padding: '0.5rem 0.75rem', textAlign: 'center', color: '#444444', letterSpacing: '0.1em' }}>
+                  ··· {hidden} MORE TRADES ···
                 </td>
               </tr>
-            ))}
+            )}
+            {tail.map(t => <TradeRow key={t.tradeNum} t={t} />)}
           </tbody>
         </table>
       </div>
+      {hidden > 0 && (
+        <div style={{ padding: '0.75rem', borderTop: '1px solid #2a2a2a', display: 'flex', alignItems: 'center', justifyContent: 'space-between', gap: '0.5rem', flexWrap: 'wrap' }}>
+          <span style={{ color: '#888888', fontFamily: "Helvetica, Arial, sans-serif", fontSize: '0.875rem' }}>
+            SHOWING FIRST/LAST {EDGE_ROWS} OF {sorted.length} TRADES
+          </span>
+          <button className="btn-ghost" style={{ fontSize: '0.875rem', padding: '0.375rem 0.75rem' }} onClick={() => setExpanded(true)}>
+            SHOW ALL
+          </button>
+        </div>
+      )}
     </div>
   );
 }
+
+function TradeRow({ t }) {
+  return (
+    <tr
+      style={{
+        borderBottom: '1px solid #1a1a1a',
+        background: t.outcome === 'WIN' ? 'rgba(0,230,118,0.03)' : 'rgba(255,23,68,0.03)',
+      }}
+    >
+      <td style={{ padding: '0.5rem 0.75rem', color: '#444444' }}>{t.tradeNum}</td>
+      <td style={{ padding: '0.5rem 0.75rem', color: '#888888', whiteSpace: 'nowrap' }}>{fmtTimestamp(t.timestamp)}</td>
+      <td style={{ padding: '0.5rem 0.75rem', color: t.direction === 'LONG' ? '#00E676' : '#FF1744' }}>
+        {t.direction === 'LONG' ? '▲' : '▼'} {t.direction}
+      </td>
+      <td style={{ padding: '0.5rem 0.75rem', color: '#E0E0E0', fontVariantNumeric: 'tabular-nums' }}>{t.entryPrice?.toFixed(4)}</td>
+      <td style={{ padding: '0.5rem 0.75rem', color: '#FFB300', fontVariantNumeric: 'tabular-nums' }}>1:{t.rr?.toFixed(2)}</td>
+      <td style={{ padding: '0.5rem 0.75rem' }}>
+        <span style={{
+          padding: '0.125rem 0.5rem',
+          fontSize: '1.0625rem',
+          textTransform: 'uppercase',
+          background: t.outcome === 'WIN' ? 'rgba(0,230,118,0.1)' : 'rgba(255,23,68,0.1)',
+          color: t.outcome === 'WIN' ? '#00E676' : '#FF1744',
+          border: `1px solid ${t.outcome === 'WIN' ? 'rgba(0,230,118,0.3)' : 'rgba(255,23,68,0.3)'}`,
+        }}>
+          {t.outcome}
+        </span>
+      </td>
+      <td style={{ padding: '0.5rem 0.75rem', textAlign: 'right', fontVariantNumeric: 'tabular-nums', fontWeight: 500, color: t.pnl >= 0 ? '#00E676' : '#FF1744' }}>
+        {t.pnl >= 0 ? '+' : ''}{fmtDollar(t.pnl)}
+      </td>
+      <td style={{ padding: '0.5rem 0.75rem', textAlign: 'right', color: '#E0E0E0', fontVariantNumeric: 'tabular-nums' }}>
+        {fmtDollar(t.capitalAfter)}
+      </td>
+    </tr>
+  );
+}
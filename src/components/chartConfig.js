@@ -0,0 +1,2 @@
+// Resizing the window re-lays out every chart on the report; settle on the final size instead of every frame
+export const RESIZE_DEBOUNCE_MS = 100;
@@ -1,20 +1,52 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 
-export function useLocalStorage(key, initialValue) {
+// writeDelay > 0 coalesces bursts of updates (e.g. typing) into one write once they pause.
+// onRestore, if given, receives a value read back from storage and returns what the state starts as.
+export function useLocalStorage(key, initialValue, writeDelay = 0, onRestore) {
   const [value, setValue] = useState(() => {
     try {
       const item = window.localStorage.getItem(key);
-      return item ? JSON.parse(item) : initialValue;
+      if (!item) return initialValue;
+      const stored = JSON.parse(item);
+      return onRestore ? onRestore(stored) : stored;
     } catch {
       return initialValue;
     }
   });
 
+  // The value read on mount is already what storage holds; only serialize real updates
+  const lastWritten = useRef(value);
+  const pendingWrite = useRef(null);
+
   useEffect(() => {
-    try {
-      window.localStorage.setItem(key, JSON.stringify(value));
-    } catch {}
-  }, [key, value]);
+    pendingWrite.current = null;
+    if (value === lastWritten.current) return;
+    const write = () => {
+      pendingWrite.current = null;
+      lastWritten.current = value;
+      try {
+        window.localStorage.setItem(key, JSON.stringify(value));
+      } catch {}
+    };
+    if (!writeDelay) {
+      write();
+      return;
+    }
+    pendingWrite.current = write;
+    const timer = setTimeout(write, writeDelay);
+    return () => clearTimeout(timer);
+  }, [key, value, writeDelay]);
+
+  // A delayed write still lands if the page is left or the component unmounts first
+  useEffect(() => {
+    if (!writeDelay) return;
+    const flush = () => pendingWrite.current?.();
+    window.addEventListener('pagehide', flush);
+    return () => {
+      window.removeEventListener('pagehide', flush);
+      flush();
+    };
+  }, [writeDelay]);
 
   const remove = () => {
     try {
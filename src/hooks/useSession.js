@@ -1,5 +1,5 @@
 import { useLocalStorage } from './useLocalStorage.js';
-import { createTradeRecord } from '../utils/tradeLogger.js';
+import { toNumber } from '../utils/calculations.js';
 
 const DEFAULT_SESSION = {
   name: '',
@@ -12,44 +12,46 @@ const DEFAULT_SESSION = {
   createdAt: null,
 };
 
+// Bulk-entry drafts are stored per session under this prefix plus the session's createdAt
+export const BULK_ROWS_KEY = 'tpsl_bulk_rows';
+
+// Drafts from earlier sessions are dropped when a new one starts, so storage doesn't accumulate them
+function clearBulkRowDrafts() {
+  try {
+    for (let i = window.localStorage.length - 1; i >= 0; i--) {
+      const key = window.localStorage.key(i);
+      if (key?.startsWith(BULK_ROWS_KEY)) window.localStorage.removeItem(key);
+    }
+  } catch {}
+}
+
+// Sessions saved before capital was parsed in initSession may hold strings or nothing at all;
+// coerce them once on load so every consumer can rely on numbers
+function restoreSession(saved) {
+  const startingCapital = toNumber(saved.startingCapital) || 10000;
+  const currentCapital = toNumber(saved.currentCapital) || startingCapital;
+  return { ...saved, startingCapital, currentCapital };
+}
+
 export function useSession() {
-  const [session, setSession, clearSession] = useLocalStorage('tpsl_session', DEFAULT_SESSION);
+  const [session, setSession, clearSession] = useLocalStorage('tpsl_session', DEFAULT_SESSION, 0, restoreSession);
 
   function initSession({ name, startingCapital, currency, mode }) {
+    // Parsed once here so every consumer can treat session capital as a number
+    const capital = parseFloat(startingCapital);
+    clearBulkRowDrafts();
     setSession({
       name,
-      startingCapital: parseFloat(startingCapital),
+      startingCapital: capital,
       currency,
       mode,
-      currentCapital: parseFloat(startingCapital),
+      currentCapital: capital,
       trades: [],
       aiAnalysis: null,
       createdAt: Date.now(),
     });
   }
 
-  function logTrade({ direction, entryPrice, atr, slMultiple, tpMultiple, leverage, outcome }) {
-    setSession(prev => {
-      const tradeNum = (prev.trades?.length || 0) + 1;
-      const trade = createTradeRecord({
-        tradeNum,
-        direction,
-        entryPrice,
-        atr,
-        slMultiple,
-        tpMultiple,
-        leverage,
-        capital: prev.currentCapital,
-        outcome,
-      });
-      return {
-        ...prev,
-        currentCapital: trade.capitalAfter,
-        trades: [...(prev.trades || []), trade],
-      };
-    });
-  }
-
   function setTrades(trades) {
     setSession(prev => {
       const finalCapital = trades.length > 0 ? trades[trades.length - 1].capitalAfter : prev.startingCapital;
@@ -68,7 +70,6 @@ export function useSession() {
   return {
     session,
     initSession,
-    logTrade,
     setTrades,
     setAiAnalysis,
     newSession,
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import BacktestBulkEntry from '../components/BacktestBulkEntry.jsx';
+import { BULK_ROWS_KEY } from '../hooks/useSession.js';
 
 function formatElapsed(seconds) {
   const h = Math.floor(seconds / 3600).toString().padStart(2, '0');
@@ -9,17 +10,27 @@ function formatElapsed(seconds) {
   return `${h}:${m}:${s}`;
 }
 
-export default function BacktestSession({ session, setTrades }) {
-  const navigate = useNavigate();
+const F = 'Helvetica, Arial, sans-serif';
+
+// Owns the 1 Hz tick so only the clock re-renders, not the bulk entry grid beside it
+function ElapsedClock() {
   const [elapsed, setElapsed] = useState(0);
-  const F = 'Helvetica, Arial, sans-serif';
 
   useEffect(() => {
-    setElapsed(0);
     const t = setInterval(() => setElapsed(s => s + 1), 1000);
     return () => clearInterval(t);
   }, []);
 
+  return (
+    <div style={{ color: '#FF6600', fontFamily: F, fontSize: '1.1rem', fontWeight: 700, fontVariantNumeric: 'tabular-nums', letterSpacing: '0.05em' }}>
+      {formatElapsed(elapsed)}
+    </div>
+  );
+}
+
+export default function BacktestSession({ session, setTrades }) {
+  const navigate = useNavigate();
+
   function handleRunBacktest(trades) {
     setTrades(trades);
     navigate('/report');
@@ -36,11 +47,10 @@ export default function BacktestSession({ session, setTrades }) {
             Starting Capital: ${session.startingCapital?.toLocaleString()} {session.currency}
           </div>
         </div>
-        <div style={{ color: '#FF6600', fontFamily: F, fontSize: '1.1rem', fontWeight: 700, fontVariantNumeric: 'tabular-nums', letterSpacing: '0.05em' }}>
-          {formatElapsed(elapsed)}
-        </div>
+        <ElapsedClock />
       </div>
       <BacktestBulkEntry
+        storageKey={`${BULK_ROWS_KEY}_${session.createdAt}`}
         startingCapital={session.startingCapital}
         onRunBacktest={handleRunBacktest}
       />
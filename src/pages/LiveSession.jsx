@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { useState, useDeferredValue } from 'react';
 import TradeEntryPanel from '../components/TradeEntryPanel.jsx';
 import LiveCalculationsPanel from '../components/LiveCalculationsPanel.jsx';
 
@@ -13,6 +13,8 @@ const DEFAULT_VALUES = {
 
 export default function LiveSession({ session }) {
   const [values, setValues] = useState(DEFAULT_VALUES);
+  // Inputs update immediately; the calculations panel catches up once typing pauses
+  const deferredValues = useDeferredValue(values);
 
   function handleChange(field, val) {
     setValues(prev => ({ ...prev, [field]: val }));
@@ -40,7 +42,7 @@ export default function LiveSession({ session }) {
         </div>
         <div>
           <LiveCalculationsPanel
-            tradeValues={values}
+            tradeValues={deferredValues}
             capital={session.currentCapital}
           />
         </div>
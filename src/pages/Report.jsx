@@ -1,4 +1,4 @@
-import { useState, useRef } from 'react';
+import { useState, useRef, useMemo } from 'react';
 import { useNavigate } from 'react-router-dom';
 import ReportSummary from '../components/ReportSummary.jsx';
 import EquityCurve from '../components/EquityCurve.jsx';
@@ -7,7 +7,6 @@ import TradeLogTable from '../components/TradeLogTable.jsx';
 import AIAnalysisPanel from '../components/AIAnalysisPanel.jsx';
 import { calcBacktestStats } from '../utils/calculations.js';
 import { exportCSV, shareSummary } from '../utils/tradeLogger.js';
-import { generatePDF } from '../utils/pdfReport.js';
 
 const PROGRESS_STEPS = [
   'Capturing charts...',
@@ -24,16 +23,21 @@ export default function Report({ session, setAiAnalysis, newSession }) {
   const [pdfError, setPdfError] = useState(null);
   const [copied, setCopied] = useState(false);
   const aiTriggerRef = useRef(null);
+  // The disabled state lags a render behind, so a quick double click could start two exports
+  const pdfBusyRef = useRef(false);
 
   const trades = session?.trades || [];
-  const stats = calcBacktestStats(trades, session?.startingCapital);
+  const startingCapital = session?.startingCapital;
+  // PDF progress and the share toggle re-render this page many times; only recompute when trades change
+  const stats = useMemo(() => calcBacktestStats(trades, startingCapital), [trades, startingCapital]);
 
   const isGenerating = pdfStep >= 0 && pdfStep < PROGRESS_STEPS.length - 1;
   const currentStepLabel = pdfStep >= 0 ? PROGRESS_STEPS[Math.min(pdfStep, PROGRESS_STEPS.length - 1)] : null;
 
   async function waitForAI() {
     // If AI analysis already exists, return it immediately
-    if (session?.aiAnalysis) return session.aiAnalysis;
+    const saved = session?.aiAnalysis;
+    if (saved) return saved;
     // Otherwise trigger via the AI panel's exposed callback
     return new Promise((resolve) => {
       if (aiTriggerRef.current) {
@@ -45,6 +49,8 @@ export default function Report({ session, setAiAnalysis, newSession }) {
   }
 
   async function handleGeneratePDF() {
+    if (pdfBusyRef.current) return;
+    pdfBusyRef.current = true;
     setPdfDone(null);
     setPdfError(null);
     setPdfStep(0);
@@ -59,13 +65,13 @@ export default function Report({ session, setAiAnalysis, newSession }) {
 
     try {
       setPdfStep(0);
+      // jsPDF, autotable and html2canvas are only fetched once a report is requested
+      const { generatePDF } = await import('../utils/pdfReport.js');
       const filename = await generatePDF({
         trades,
         stats,
         session: { ...session, aiAnalysis },
         aiAnalysis,
-        equityCurveId: 'equity-curve',
-        chartsId: 'distribution-charts',
         onProgress: (msg) => {
           const idx = PROGRESS_STEPS.indexOf(msg);
           if (idx >= 0) setPdfStep(idx);
@@ -76,6 +82,8 @@ export default function Report({ session, setAiAnalysis, newSession }) {
     } catch (err) {
       setPdfError(`PDF generation failed: ${err.message}`);
       setPdfStep(-1);
+    } finally {
+      pdfBusyRef.current = false;
     }
     setTimeout(() => { setPdfStep(-1); setPdfDone(null); setPdfError(null); }, 6000);
   }
@@ -121,7 +129,7 @@ export default function Report({ session, setAiAnalysis, newSession }) {
             {session?.name || 'BACKTEST REPORT'}
           </div>
           <div style={{ color: '#444444', fontFamily: "Helvetica, Arial, sans-serif", fontSize: '1.0625rem' }}>
-            {trades.length} trades · {session?.currency} · Starting capital: ${session?.startingCapital?.toLocaleString()}
+            {trades.length} trades · {session?.currency} · Starting capital: ${startingCapital?.toLocaleString()}
           </div>
         </div>
 
@@ -207,12 +215,12 @@ export default function Report({ session, setAiAnalysis, newSession }) {
       {/* Main grid: Summary + Equity Curve */}
       <div style={{ display: 'grid', gridTemplateColumns: 'repeat(auto-fit, minmax(300px, 1fr))', gap: '1rem', marginBottom: '1rem' }}>
         <div style={{ minWidth: 0 }}>
-          <ReportSummary stats={stats} startingCapital={session?.startingCapital} />
+          <ReportSummary stats={stats} startingCapital={startingCapital} />
         </div>
         <div style={{ minWidth: 0 }}>
           <EquityCurve
             trades={trades}
-            startingCapital={session?.startingCapital}
+            startingCapital={startingCapital}
             maxDDStart={stats?.maxDDStart}
             maxDDEnd={stats?.maxDDEnd}
             id="equity-curve"
@@ -222,7 +230,7 @@ export default function Report({ session, setAiAnalysis, newSession }) {
 
       {/* Distribution charts */}
       <div style={{ marginBottom: '1rem' }}>
-        <DistributionCharts trades={trades} id="distribution-charts" />
+        <DistributionCharts trades={trades} wins={stats.wins} losses={stats.losses} id="distribution-charts" />
       </div>
 
       {/* Full trade log */}
@@ -239,13 +247,6 @@ export default function Report({ session, setAiAnalysis, newSession }) {
         onAnalysisComplete={setAiAnalysis}
         triggerRef={aiTriggerRef}
       />
-
-      <style>{`
-        @keyframes pulse {
-          from { opacity: 0.3; transform: scaleY(0.8); }
-          to { opacity: 1; transform: scaleY(1.2); }
-        }
-      `}</style>
     </div>
   );
 }
@@ -1,36 +1,47 @@
+// Inputs arrive as form strings or already-parsed numbers; only strings need parsing
+export function toNumber(v) {
+  return typeof v === 'number' ? v : parseFloat(v);
+}
+
 export function calcTrade({ direction, entryPrice, atr, slMultiple, tpPrice: tpPriceInput, tpMultiple, leverage, capital }) {
-  const entry = parseFloat(entryPrice) || 0;
-  const atrVal = parseFloat(atr) || 0;
-  const slMult = parseFloat(slMultiple) || 1;
-  const lev = parseFloat(leverage) || 1;
-  const cap = parseFloat(capital) || 10000;
+  const entry = toNumber(entryPrice) || 0;
+  const atrVal = toNumber(atr) || 0;
+  const slMult = toNumber(slMultiple) || 1;
+  const lev = toNumber(leverage) || 1;
+  const cap = toNumber(capital) || 10000;
+
+  // +1 for longs, -1 for shorts: SL sits below entry for longs and above for shorts
+  const sign = direction === 'LONG' ? 1 : -1;
 
   const slDist = atrVal * slMult;
-  const slPrice = direction === 'LONG' ? entry - slDist : entry + slDist;
+  const slPrice = entry - sign * slDist;
 
   // TP: use direct price if provided, otherwise fall back to multiple
-  let tpPrice, tpDist;
-  const tpPriceParsed = parseFloat(tpPriceInput);
+  let tpPrice, tpDist, rr;
+  const tpPriceParsed = toNumber(tpPriceInput);
   if (tpPriceInput && tpPriceParsed > 0) {
     tpPrice = tpPriceParsed;
-    tpDist = direction === 'LONG' ? tpPrice - entry : entry - tpPrice;
+    tpDist = Math.abs(tpPrice - entry);
+    rr = slDist > 0 ? tpDist / slDist : 0;
   } else {
-    const tpMult = parseFloat(tpMultiple) || 2;
-    tpDist = atrVal * tpMult;
-    tpPrice = direction === 'LONG' ? entry + tpDist : entry - tpDist;
+    const tpMult = toNumber(tpMultiple) || 2;
+    tpDist = Math.abs(atrVal * tpMult);
+    tpPrice = entry + sign * atrVal * tpMult;
+    // Both distances are multiples of the same ATR, so R:R is just the ratio of the multiples
+    rr = slDist > 0 ? tpMult / slMult : 0;
   }
 
-  // Ensure tpDist is positive
-  tpDist = Math.abs(tpDist);
-
-  const slPct = entry > 0 ? (slDist / entry) * 100 : 0;
-  const tpPct = entry > 0 ? (tpDist / entry) * 100 : 0;
+  // Distances as a fraction of entry; every percentage and money figure below derives from these
+  const invEntry = entry > 0 ? 1 / entry : 0;
+  const slFrac = slDist * invEntry;
+  const tpFrac = tpDist * invEntry;
 
-  const rr = slDist > 0 ? tpDist / slDist : 0;
+  const slPct = slFrac * 100;
+  const tpPct = tpFrac * 100;
 
   const positionSize = cap * lev;
-  const maxLoss = entry > 0 ? positionSize * (slDist / entry) : 0;
-  const maxGain = entry > 0 ? positionSize * (tpDist / entry) : 0;
+  const maxLoss = positionSize * slFrac;
+  const maxGain = positionSize * tpFrac;
 
   const maxLossPct = cap > 0 ? (maxLoss / cap) * 100 : 0;
   const maxGainPct = cap > 0 ? (maxGain / cap) * 100 : 0;
@@ -52,80 +63,130 @@ export function calcTrade({ direction, entryPrice, atr, slMultiple, tpPrice: tpP
   };
 }
 
-export function applyTradeOutcome({ capital, outcome, maxGain, maxLoss }) {
-  if (outcome === 'WIN') return capital + maxGain;
-  if (outcome === 'LOSS') return capital - maxLoss;
-  return capital;
+// Money is settled to the cent so compounded capital reproduces exactly from the logged P&L
+export function roundCents(value) {
+  return Math.round(value * 100) / 100;
 }
 
-export function calcBacktestStats(trades, startingCapital) {
-  if (!trades || trades.length === 0) return null;
-
-  const wins = trades.filter(t => t.outcome === 'WIN');
-  const losses = trades.filter(t => t.outcome === 'LOSS');
-
-  const totalPnL = trades.reduce((sum, t) => sum + t.pnl, 0);
-  const totalPnLPct = startingCapital > 0 ? (totalPnL / startingCapital) * 100 : 0;
-
-  const winRate = trades.length > 0 ? (wins.length / trades.length) * 100 : 0;
-
-  const avgWin = wins.length > 0 ? wins.reduce((s, t) => s + t.pnl, 0) / wins.length : 0;
-  const avgLoss = losses.length > 0 ? Math.abs(losses.reduce((s, t) => s + t.pnl, 0) / losses.length) : 0;
+// Capital before the first trade followed by capital after each trade, filled in one pass
+export function equitySeries(trades, startingCapital) {
+  const n = trades.length;
+  const out = new Float64Array(n + 1);
+  out[0] = startingCapital;
+  for (let i = 0; i < n; i++) out[i + 1] = trades[i].capitalAfter;
+  return out;
+}
 
-  const largestWin = wins.length > 0 ? Math.max(...wins.map(t => t.pnl)) : 0;
-  const largestLoss = losses.length > 0 ? Math.abs(Math.min(...losses.map(t => t.pnl))) : 0;
+export const OUTCOME_CODE = { WIN: 1, LOSS: 2 };
+
+// Trade arrays are replaced, never mutated, so the columns for a given array can be reused
+const columnsCache = new WeakMap();
+
+// Struct-of-arrays view of the trade log so stats loops touch contiguous typed memory
+export function tradeColumns(trades) {
+  const cached = columnsCache.get(trades);
+  if (cached) return cached;
+
+  const n = trades.length;
+  const pnl = new Float64Array(n);
+  const capitalAfter = new Float64Array(n);
+  const rr = new Float64Array(n);
+  const outcome = new Uint8Array(n);
+  for (let i = 0; i < n; i++) {
+    const t = trades[i];
+    pnl[i] = t.pnl;
+    capitalAfter[i] = t.capitalAfter;
+    rr[i] = t.rr || 0;
+    outcome[i] = OUTCOME_CODE[t.outcome] || 0;
+  }
+  const columns = { n, pnl, capitalAfter, rr, outcome };
+  columnsCache.set(trades, columns);
+  return columns;
+}
 
-  // Max drawdown
-  let peak = startingCapital;
-  let maxDD = 0;
-  let maxDDStart = 0;
-  let maxDDEnd = 0;
-  let ddStart = 0;
-  let capitals = [startingCapital, ...trades.map(t => t.capitalAfter)];
+export function calcBacktestStats(trades, startingCapital) {
+  if (!trades || trades.length === 0) return null;
 
-  for (let i = 0; i < capitals.length; i++) {
-    if (capitals[i] > peak) {
-      peak = capitals[i];
-      ddStart = i;
+  const { n, pnl, capitalAfter, rr, outcome } = tradeColumns(trades);
+
+  let wins = 0, losses = 0;
+  let totalPnL = 0, grossWins = 0, lossSum = 0, rrSum = 0;
+  let largestWin = -Infinity, minLoss = Infinity;
+  // Running mean / sum of squared deviations (Welford) so Sharpe needs no second pass
+  let mean = 0, m2 = 0;
+  // Drawdown indices are into the equity series, where 0 is the starting capital
+  let peak = startingCapital, lowest = startingCapital;
+  let maxDD = 0, maxDDStart = 0, maxDDEnd = 0, ddStart = 0;
+  // Deepest fall relative to its own peak; may be a different episode from the largest dollar drop
+  let maxDDRatio = 0;
+  for (let i = 0; i < n; i++) {
+    const v = pnl[i];
+    totalPnL += v;
+    rrSum += rr[i];
+
+    const delta = v - mean;
+    mean += delta / (i + 1);
+    m2 += delta * (v - mean);
+
+    const cap = capitalAfter[i];
+    if (cap > peak) {
+      peak = cap;
+      ddStart = i + 1;
     }
-    const dd = peak - capitals[i];
+    if (cap < lowest) lowest = cap;
+    const dd = peak - cap;
+    const ddRatio = peak > 0 ? dd / peak : 0;
+    if (ddRatio > maxDDRatio) maxDDRatio = ddRatio;
     if (dd > maxDD) {
       maxDD = dd;
       maxDDStart = ddStart;
-      maxDDEnd = i;
+      maxDDEnd = i + 1;
+    }
+
+    if (outcome[i] === OUTCOME_CODE.WIN) {
+      wins++;
+      grossWins += v;
+      if (v > largestWin) largestWin = v;
+    } else if (outcome[i] === OUTCOME_CODE.LOSS) {
+      losses++;
+      lossSum += v;
+      if (v < minLoss) minLoss = v;
     }
   }
 
-  const maxDDPct = peak > 0 ? (maxDD / peak) * 100 : 0;
+  const totalPnLPct = startingCapital > 0 ? (totalPnL / startingCapital) * 100 : 0;
+
+  const winRate = (wins / n) * 100;
+
+  const avgWin = wins > 0 ? grossWins / wins : 0;
+  const avgLoss = losses > 0 ? Math.abs(lossSum / losses) : 0;
+
+  if (wins === 0) largestWin = 0;
+  const largestLoss = losses > 0 ? Math.abs(minLoss) : 0;
+
+  const maxDDPct = maxDDRatio * 100;
 
   // Sharpe ratio
-  const pnls = trades.map(t => t.pnl);
-  const mean = pnls.reduce((s, v) => s + v, 0) / pnls.length;
-  const variance = pnls.reduce((s, v) => s + Math.pow(v - mean, 2), 0) / pnls.length;
+  const variance = m2 / n;
   const stdDev = Math.sqrt(variance);
   const sharpe = stdDev > 0 ? mean / stdDev : 0;
 
   // Profit factor
-  const grossWins = wins.reduce((s, t) => s + t.pnl, 0);
-  const grossLosses = Math.abs(losses.reduce((s, t) => s + t.pnl, 0));
+  const grossLosses = Math.abs(lossSum);
   const profitFactor = grossLosses > 0 ? grossWins / grossLosses : grossWins > 0 ? Infinity : 0;
 
-  const expectancy = trades.length > 0 ? totalPnL / trades.length : 0;
-  const avgRR = trades.length > 0 ? trades.reduce((s, t) => s + (t.rr || 0), 0) / trades.length : 0;
+  const expectancy = totalPnL / n;
+  const avgRR = rrSum / n;
 
   // Best multiples/params
-  const slGroups = groupBy(trades, 'slMultiple');
-  const tpGroups = groupBy(trades, 'tpMultiple');
-  const levGroups = groupBy(trades, 'leverage');
-
-  const bestSL = bestGroup(slGroups);
-  const bestTP = bestGroup(tpGroups);
-  const bestLev = bestGroup(levGroups);
+  const bestSL = bestGroup(groupPnL(trades, pnl, 'slMultiple'));
+  const bestTP = bestGroup(groupPnL(trades, pnl, 'tpMultiple'));
+  const bestLev = bestGroup(groupPnL(trades, pnl, 'leverage'));
 
   return {
-    totalTrades: trades.length,
-    wins: wins.length,
-    losses: losses.length,
+    totalTrades: n,
+    wins,
+    losses,
     winRate,
     totalPnL,
     totalPnLPct,
@@ -137,6 +198,8 @@ export function calcBacktestStats(trades, startingCapital) {
     maxDDPct,
     maxDDStart,
     maxDDEnd,
+    peakCapital: peak,
+    lowestCapital: lowest,
     sharpe,
     profitFactor,
     expectancy,
@@ -144,24 +207,24 @@ export function calcBacktestStats(trades, startingCapital) {
     bestSL,
     bestTP,
     bestLev,
-    capitals,
+    capitals: equitySeries(trades, startingCapital),
   };
 }
 
-function groupBy(arr, key) {
-  return arr.reduce((acc, item) => {
-    const k = item[key];
-    if (!acc[k]) acc[k] = [];
-    acc[k].push(item);
-    return acc;
-  }, {});
+// Net P&L per distinct value of key; only the running totals are kept, not the member trades
+function groupPnL(trades, pnl, key) {
+  const totals = {};
+  for (let i = 0; i < trades.length; i++) {
+    const k = trades[i][key];
+    totals[k] = (totals[k] ?? 0) + pnl[i];
+  }
+  return totals;
 }
 
-function bestGroup(groups) {
+function bestGroup(totals) {
   let best = null;
   let bestPnL = -Infinity;
-  for (const [key, trades] of Object.entries(groups)) {
-    const total = trades.reduce((s, t) => s + t.pnl, 0);
+  for (const [key, total] of Object.entries(totals)) {
     if (total > bestPnL) {
       bestPnL = total;
       best = key;
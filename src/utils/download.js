@@ -0,0 +1,11 @@
+// Hands a Blob to the browser as a file download without copying it into a data URL
+export function downloadBlob(blob, filename) {
+  const url = URL.createObjectURL(blob);
+  const a = document.createElement('a');
+  a.href = url;
+  a.download = filename;
+  a.click();
+  // Some browsers keep reading the blob well after click() returns, and there is no event for
+  // when they finish; hold the URL long enough for a large file, as FileSaver.js does
+  setTimeout(() => URL.revokeObjectURL(url), 40000);
+}
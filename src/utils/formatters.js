@@ -3,11 +3,23 @@ export function fmtPrice(val, decimals = 4) {
   return Number(val).toFixed(decimals);
 }
 
+// Grouped en-US number formatters, one per decimal count, built on first use
+const groupedFormats = new Map();
+
+function groupedFormat(decimals) {
+  let format = groupedFormats.get(decimals);
+  if (!format) {
+    format = new Intl.NumberFormat('en-US', { minimumFractionDigits: decimals, maximumFractionDigits: decimals });
+    groupedFormats.set(decimals, format);
+  }
+  return format;
+}
+
 export function fmtDollar(val, decimals = 2) {
   if (val === null || val === undefined || isNaN(val)) return '—';
   const abs = Math.abs(val);
   const prefix = val < 0 ? '-$' : '$';
-  return `${prefix}${abs.toLocaleString('en-US', { minimumFractionDigits: decimals, maximumFractionDigits: decimals })}`;
+  return `${prefix}${groupedFormat(decimals).format(abs)}`;
 }
 
 export function fmtPct(val, decimals = 2) {
@@ -25,18 +37,24 @@ export function fmtMultiple(val) {
   return `${val}x`;
 }
 
+// toLocaleString builds a new formatter (and resolves locale data) on every call; build it once
+const timestampFormat = new Intl.DateTimeFormat('en-US', { month: 'short', day: '2-digit', hour: '2-digit', minute: '2-digit', second: '2-digit', hour12: false });
+
 export function fmtTimestamp(ts) {
   if (!ts) return '—';
+  // Same input handling as Date#toLocaleString: strings are parsed, invalid dates don't throw
   const d = new Date(ts);
-  return d.toLocaleString('en-US', { month: 'short', day: '2-digit', hour: '2-digit', minute: '2-digit', second: '2-digit', hour12: false });
+  if (isNaN(d)) return 'Invalid Date';
+  return timestampFormat.format(d);
 }
 
+const CURRENCY_SYMBOLS = { USD: '$', CAD: 'C$', GBP: '£', EUR: '€' };
+
 export function fmtCurrency(amount, currency = 'USD') {
-  const symbols = { USD: '$', CAD: 'C$', GBP: '£', EUR: '€' };
-  const sym = symbols[currency] || '$';
+  const sym = CURRENCY_SYMBOLS[currency] || '$';
   const abs = Math.abs(amount);
   const prefix = amount < 0 ? `-${sym}` : sym;
-  return `${prefix}${abs.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}`;
+  return `${prefix}${groupedFormat(2).format(abs)}`;
 }
 
 export function pnlColor(val) {
@@ -1,6 +1,6 @@
 import jsPDF from 'jspdf';
 import autoTable from 'jspdf-autotable';
-import html2canvas from 'html2canvas';
+import { downloadBlob } from './download.js';
 
 const AMBER = [255, 102, 0];
 const BLACK = [10, 10, 10];
@@ -12,7 +12,33 @@ const RED_BG = [255, 235, 238];
 const WIN_COLOR = [0, 150, 68];
 const LOSS_COLOR = [200, 20, 50];
 
-function addHeader(doc, pageTitle, sessionName) {
+// autoTable copies these into each cell's styles, so one set serves every report
+const METRICS_TABLE_STYLE = {
+  styles: { font: 'helvetica', fontSize: 11, cellPadding: 3, lineColor: [220, 220, 220], lineWidth: 0.2 },
+  headStyles: { fillColor: LIGHT_GREY, textColor: BLACK, fontStyle: 'bold', lineWidth: { bottom: 1 }, lineColor: { bottom: AMBER } },
+  alternateRowStyles: { fillColor: [249, 249, 249] },
+  columnStyles: {
+    0: { textColor: GREY, fontStyle: 'normal' },
+    1: { textColor: BLACK, fontStyle: 'bold', halign: 'right' },
+  },
+};
+
+const CAPITAL_TABLE_STYLE = {
+  styles: { font: 'helvetica', fontSize: 10, cellPadding: 2.5 },
+  headStyles: { fillColor: LIGHT_GREY, textColor: BLACK, fontStyle: 'bold' },
+  columnStyles: { 0: { textColor: GREY }, 1: { textColor: BLACK, fontStyle: 'bold', halign: 'right' } },
+};
+
+const TRADE_LOG_HEAD = [['#', 'DIR', 'ENTRY', 'ATR', 'SL', 'TP', 'LEV', 'SL $', 'TP $', 'R:R', 'RESULT', 'P&L', 'CAPITAL']];
+const TRADE_LOG_TABLE_STYLE = {
+  styles: { font: 'helvetica', fontSize: 8, cellPadding: 1.5, lineColor: [220, 220, 220], lineWidth: 0.2 },
+  headStyles: { fillColor: LIGHT_GREY, textColor: BLACK, fontStyle: 'bold', fontSize: 8 },
+  bodyStyles: { textColor: BLACK },
+};
+
+const AI_SECTIONS = ['STRATEGY OVERVIEW', 'SL MULTIPLE ANALYSIS', 'TP MULTIPLE ANALYSIS', 'LEVERAGE ASSESSMENT', 'DIRECTIONAL BIAS', 'PATTERN OBSERVATIONS', 'RISK MANAGEMENT SCORE', 'THREE RECOMMENDATIONS', 'VERDICT'];
+
+function addHeader(doc, pageTitle) {
   const w = doc.internal.pageSize.width;
   doc.setFontSize(13);
   doc.setFont('helvetica', 'bold');
@@ -61,16 +87,170 @@ function sectionHeading(doc, title, y) {
   return y + 16;
 }
 
-export async function generatePDF({ trades, stats, session, aiAnalysis, equityCurveId, chartsId, onProgress }) {
-  const doc = new jsPDF({ orientation: 'portrait', unit: 'mm', format: 'a4' });
-  const w = doc.internal.pageSize.width;
-  const h = doc.internal.pageSize.height;
-  const margin = 22;
+// Plots capital per trade with jsPDF line primitives so the curve stays vector in the PDF
+function drawEquityCurve(doc, capitals, startCapital, trades, x, y, width, height) {
+  const n = capitals.length;
+  let min = startCapital, max = startCapital;
+  for (let i = 0; i < n; i++) {
+    if (capitals[i] < min) min = capitals[i];
+    if (capitals[i] > max) max = capitals[i];
+  }
+  const pad = (max - min) * 0.06 || Math.abs(max) * 0.01 || 1;
+  min -= pad;
+  max += pad;
+
+  const plotX = x + 18;
+  const plotW = width - 18;
+  const plotH = height - 8;
+  const px = i => plotX + (n > 1 ? (i / (n - 1)) * plotW : plotW / 2);
+  const py = v => y + plotH - ((v - min) / (max - min)) * plotH;
+
+  doc.setFontSize(7);
+  doc.setFont('helvetica', 'normal');
+  doc.setTextColor(...GREY);
+  doc.setDrawColor(230, 230, 230);
+  doc.setLineWidth(0.2);
+  for (let k = 0; k <= 4; k++) {
+    const v = min + ((max - min) * k) / 4;
+    doc.line(plotX, py(v), plotX + plotW, py(v));
+    doc.text('$' + v.toFixed(0), plotX - 2, py(v) + 1, { align: 'right' });
+  }
+  doc.text('0', plotX, y + plotH + 5, { align: 'center' });
+  doc.text('TRADE #', plotX + plotW / 2, y + plotH + 5, { align: 'center' });
+  doc.text(String(n - 1), plotX + plotW, y + plotH + 5, { align: 'center' });
+
+  doc.setDrawColor(...AMBER);
+  doc.setLineWidth(0.3);
+  doc.setLineDashPattern([1.5, 1.5], 0);
+  doc.line(plotX, py(startCapital), plotX + plotW, py(startCapital));
+  doc.setLineDashPattern([], 0);
+
+  const segments = [];
+  for (let i = 1; i < n; i++) {
+    segments.push([px(i) - px(i - 1), py(capitals[i]) - py(capitals[i - 1])]);
+  }
+  doc.setDrawColor(...(capitals[n - 1] >= startCapital ? WIN_COLOR : LOSS_COLOR));
+  doc.setLineWidth(0.5);
+  if (segments.length) doc.lines(segments, px(0), py(capitals[0]), [1, 1], 'S');
+
+  // Per-trade markers turn into a solid smear past a couple hundred points
+  const withDots = n <= 200;
+  if (withDots) {
+    for (let i = 1; i < n; i++) {
+      doc.setFillColor(...(trades[i - 1]?.outcome === 'WIN' ? WIN_COLOR : LOSS_COLOR));
+      doc.circle(px(i), py(capitals[i]), 0.7, 'F');
+    }
+  }
+  return withDots;
+}
+
+const PIE_WIN = [0, 230, 118];
+const PIE_LOSS = [255, 23, 68];
+
+// Win/loss split drawn as filled wedges, styled like the captured dark chart panels beside it
+function drawWinLossPie(doc, wins, losses, x, y, width, height) {
+  doc.setFillColor(17, 17, 17);
+  doc.rect(x, y, width, height, 'F');
+  doc.setFontSize(6.5);
+  doc.setFont('helvetica', 'normal');
+  doc.setTextColor(...AMBER);
+  doc.text('WIN / LOSS DISTRIBUTION', x + 4, y + 5);
+
+  const total = wins + losses;
+  if (total === 0) return;
+
+  const cx = x + width / 2;
+  const cy = y + 4 + height / 2;
+  const r = Math.min(width, height - 8) * 0.32;
+  const slices = [['WIN', wins, PIE_WIN], ['LOSS', losses, PIE_LOSS]];
+
+  // Counter-clockwise from three o'clock, matching the on-screen Recharts pie
+  let start = 0;
+  doc.setFontSize(7);
+  for (const [name, value, color] of slices) {
+    if (value === 0) continue;
+    const sweep = (value / total) * 2 * Math.PI;
+    doc.setFillColor(...color);
+    if (value === total) {
+      doc.circle(cx, cy, r, 'F');
+    } else {
+      const steps = Math.max(2, Math.ceil(sweep / 0.05));
+      const segments = [];
+      let px = cx, py = cy;
+      for (let k = 0; k <= steps; k++) {
+        const a = start + (sweep * k) / steps;
+        const nx = cx + r * Math.cos(a);
+        const ny = cy - r * Math.sin(a);
+        segments.push([nx - px, ny - py]);
+        px = nx;
+        py = ny;
+      }
+      doc.lines(segments, cx, cy, [1, 1], 'F', true);
+    }
+
+    const mid = start + sweep / 2;
+    const lx = cx + r * 1.2 * Math.cos(mid);
+    const ly = cy - r * 1.2 * Math.sin(mid);
+    doc.setTextColor(...color);
+    doc.text(`${name} ${Math.round((value / total) * 100)}%`, lx, ly + 1, { align: Math.cos(mid) >= 0 ? 'left' : 'right' });
+    start += sweep;
+  }
+}
+
+// Charts are placed two per row, about 80 mm wide, so ~640 px is already ~200 dpi on the page
+const CHART_CAPTURE_PX = 640;
+
+// Chart captures per trades array, reused when only the AI text or session details changed
+const captureCache = new WeakMap();
+
+// The win/loss pie (pdf-chart-0) is drawn directly by drawWinLossPie, so only the bar charts are rasterised
+async function captureCharts(trades) {
+  const chartEls = [1, 2, 3, 4].map(i => document.getElementById(`pdf-chart-${i}`)).filter(Boolean);
+  // A resized layout reflows the charts, so the panel widths are part of the key
+  const layout = chartEls.map(el => el.offsetWidth).join(',');
+  const cached = captureCache.get(trades);
+  if (cached && cached.layout === layout) return cached.images;
+
+  // Only needed on a cache miss, so it is fetched here rather than with the module
+  const { default: html2canvas } = await import('html2canvas');
+  const images = [];
+  for (const el of chartEls) {
+    try {
+      const scale = Math.min(2.5, Math.max(1, CHART_CAPTURE_PX / el.offsetWidth));
+      const c = await html2canvas(el, { backgroundColor: '#111111', scale });
+      // jsPDF embeds JPEG bytes as-is, whereas PNG is decoded and re-deflated on every addImage
+      images.push({ data: c.toDataURL('image/jpeg', 0.92), w: c.width, h: c.height });
+      // Only the data URL is kept; zeroing the canvas frees its backing store now rather than at GC
+      c.width = c.height = 0;
+    } catch (e) { images.push(null); }
+  }
+  captureCache.set(trades, { layout, images });
+  return images;
+}
+
+// Last built report per trades array. Trade arrays are replaced, never mutated, so a
+// repeat export only needs to check the other inputs that end up on the page.
+const reportCache = new WeakMap();
+
+export async function generatePDF({ trades, stats, session, aiAnalysis, onProgress }) {
   const sessionName = session?.name || 'Trading Session';
   const currency = session?.currency || 'USD';
-  const startCapital = session?.startingCapital || 10000;
+  const startCapital = session?.startingCapital;
   const finalCapital = session?.currentCapital || startCapital;
   const dateStr = new Date().toLocaleDateString('en-US', { year: 'numeric', month: 'long', day: 'numeric' });
+  const filename = `TP-SL-Pro-Report-${(sessionName || 'Session').replace(/\s+/g, '-')}-${new Date().toISOString().slice(0, 10)}.pdf`;
+
+  const cached = reportCache.get(trades);
+  if (cached && cached.aiAnalysis === aiAnalysis && cached.sessionName === sessionName && cached.currency === currency && cached.dateStr === dateStr) {
+    onProgress?.('Download ready.');
+    downloadBlob(cached.blob, filename);
+    return filename;
+  }
+
+  const doc = new jsPDF({ orientation: 'portrait', unit: 'mm', format: 'a4' });
+  const w = doc.internal.pageSize.width;
+  const h = doc.internal.pageSize.height;
+  const margin = 22;
 
   // ── PAGE 1: COVER ──────────────────────────────────────────────────
   onProgress?.('Building cover page...');
@@ -133,7 +313,7 @@ export async function generatePDF({ trades, stats, session, aiAnalysis, equityCu
   // ── PAGE 2: PERFORMANCE SUMMARY ────────────────────────────────────
   onProgress?.('Compiling performance metrics...');
   doc.addPage();
-  addHeader(doc, 'PERFORMANCE METRICS', sessionName);
+  addHeader(doc, 'PERFORMANCE METRICS');
   addFooter(doc, 2, sessionName);
 
   let y = sectionHeading(doc, 'PERFORMANCE METRICS', 26);
@@ -165,35 +345,22 @@ export async function generatePDF({ trades, stats, session, aiAnalysis, equityCu
     margin: { left: margin, right: margin },
     head: [['METRIC', 'VALUE']],
     body: metricRows,
-    styles: { font: 'helvetica', fontSize: 11, cellPadding: 3, lineColor: [220, 220, 220], lineWidth: 0.2 },
-    headStyles: { fillColor: LIGHT_GREY, textColor: BLACK, fontStyle: 'bold', lineWidth: { bottom: 1 }, lineColor: { bottom: AMBER } },
-    alternateRowStyles: { fillColor: [249, 249, 249] },
-    columnStyles: {
-      0: { textColor: GREY, fontStyle: 'normal' },
-      1: { textColor: BLACK, fontStyle: 'bold', halign: 'right' },
-    },
+    ...METRICS_TABLE_STYLE,
   });
 
   // ── PAGE 3: EQUITY CURVE ───────────────────────────────────────────
   onProgress?.('Capturing equity curve...');
   doc.addPage();
-  addHeader(doc, 'EQUITY CURVE', sessionName);
+  addHeader(doc, 'EQUITY CURVE');
   addFooter(doc, 3, sessionName);
   y = sectionHeading(doc, 'EQUITY CURVE', 26);
 
-  const equityEl = document.getElementById(equityCurveId);
-  if (equityEl) {
-    try {
-      const canvas = await html2canvas(equityEl, { backgroundColor: '#111111', scale: 2.5 });
-      const imgData = canvas.toDataURL('image/png');
-      const naturalH = (canvas.height / canvas.width) * (w - margin * 2);
-      const imgH = Math.min(naturalH, h - y - 80);
-      doc.addImage(imgData, 'PNG', margin, y + 2, w - margin * 2, imgH);
-      y = y + imgH + 8;
-    } catch (e) {}
-  }
+  const curveH = 90;
+  const withDots = drawEquityCurve(doc, stats?.capitals || [startCapital], startCapital, trades, margin, y + 4, w - margin * 2, curveH);
+  y = y + curveH + 14;
 
-  const chartCaption = `Equity curve showing capital progression across ${trades.length} trades. Green dots represent winning trades, red dots represent losing trades. Dashed line indicates starting capital of $${startCapital.toLocaleString()}.`;
+  const dotNote = withDots ? ' Green dots represent winning trades, red dots represent losing trades.' : '';
+  const chartCaption = `Equity curve showing capital progression across ${trades.length} trades.${dotNote} Dashed line indicates starting capital of $${startCapital.toLocaleString()}.`;
   doc.setFontSize(9);
   doc.setFont('helvetica', 'italic');
   doc.setTextColor(...GREY);
@@ -201,8 +368,8 @@ export async function generatePDF({ trades, stats, session, aiAnalysis, equityCu
   doc.text(lines, margin, y + 4);
   y += lines.length * 5 + 10;
 
-  const peakCapital = Math.max(...(stats?.capitals || [startCapital]));
-  const lowestCapital = Math.min(...(stats?.capitals || [startCapital]));
+  const peakCapital = stats?.peakCapital ?? startCapital;
+  const lowestCapital = stats?.lowestCapital ?? startCapital;
 
   autoTable(doc, {
     startY: y,
@@ -214,34 +381,33 @@ export async function generatePDF({ trades, stats, session, aiAnalysis, equityCu
       ['Lowest Capital', '$' + lowestCapital.toFixed(2)],
       ['Final Capital', '$' + finalCapital.toFixed(2)],
     ],
-    styles: { font: 'helvetica', fontSize: 10, cellPadding: 2.5 },
-    headStyles: { fillColor: LIGHT_GREY, textColor: BLACK, fontStyle: 'bold' },
-    columnStyles: { 0: { textColor: GREY }, 1: { textColor: BLACK, fontStyle: 'bold', halign: 'right' } },
+    ...CAPITAL_TABLE_STYLE,
   });
 
   // ── PAGE 4: DISTRIBUTION CHARTS ────────────────────────────────────
   onProgress?.('Capturing distribution charts...');
   doc.addPage();
-  addHeader(doc, 'TRADE DISTRIBUTION', sessionName);
+  addHeader(doc, 'TRADE DISTRIBUTION');
   addFooter(doc, 4, sessionName);
   y = sectionHeading(doc, 'TRADE DISTRIBUTION ANALYSIS', 26);
 
-  const chartEls = [0, 1, 2, 3, 4].map(i => document.getElementById(`pdf-chart-${i}`)).filter(Boolean);
-  const chartImages = [];
-  for (const el of chartEls) {
-    try {
-      const c = await html2canvas(el, { backgroundColor: '#111111', scale: 2.5 });
-      chartImages.push({ data: c.toDataURL('image/png'), w: c.width, h: c.height });
-    } catch (e) { chartImages.push(null); }
-  }
+  const chartImages = await captureCharts(trades);
 
   // Place 2 per row, preserving each chart's natural aspect ratio
   const cellW = (w - margin * 2 - 6) / 2;
   let cx = margin, cy = y + 2;
   let rowH = 0;
 
-  chartImages.forEach((img, i) => {
+  // The pie takes the first cell, sized like the captured panels it sits next to
+  const firstImg = chartImages.find(Boolean);
+  const pieH = Math.round(firstImg ? (firstImg.h / firstImg.w) * cellW : cellW * 0.75);
+  drawWinLossPie(doc, stats?.wins ?? 0, stats?.losses ?? 0, cx, cy, cellW, pieH);
+  rowH = pieH;
+  cx += cellW + 6;
+
+  chartImages.forEach((img, k) => {
     if (!img) return;
+    const i = k + 1;
     const cellH = Math.round((img.h / img.w) * cellW);
 
     // Start a new row every 2 charts
@@ -254,56 +420,59 @@ export async function generatePDF({ trades, stats, session, aiAnalysis, equityCu
     // New page if needed
     if (cy + cellH > h - 45) {
       doc.addPage();
-      addHeader(doc, 'TRADE DISTRIBUTION', sessionName);
+      addHeader(doc, 'TRADE DISTRIBUTION');
       addFooter(doc, doc.internal.getNumberOfPages(), sessionName);
       cy = 30; cx = margin; rowH = 0;
     }
 
-    doc.addImage(img.data, 'PNG', cx, cy, cellW, cellH);
+    doc.addImage(img.data, 'JPEG', cx, cy, cellW, cellH);
     rowH = Math.max(rowH, cellH);
     cx += cellW + 6;
   });
 
   // ── PAGE 5: FULL TRADE LOG ─────────────────────────────────────────
   onProgress?.('Rendering trade log...');
+  // Header and footer come from didDrawPage below, which also fires for this first page
   doc.addPage();
-  addHeader(doc, 'COMPLETE TRADE LOG', sessionName);
-  addFooter(doc, doc.internal.getNumberOfPages(), sessionName);
   y = sectionHeading(doc, 'COMPLETE TRADE LOG', 26);
 
-  const tradeRows = trades.map(t => [
-    t.tradeNum,
-    t.direction,
-    t.entryPrice?.toFixed(4),
-    t.atr?.toFixed(4),
-    t.slMultiple + 'x',
-    t.tpMultiple + 'x',
-    t.leverage + 'x',
-    t.slPrice?.toFixed(4),
-    t.tpPrice?.toFixed(4),
-    '1:' + t.rr?.toFixed(2),
-    t.outcome,
-    (t.pnl >= 0 ? '+$' : '-$') + Math.abs(t.pnl).toFixed(2),
-    '$' + t.capitalAfter?.toFixed(2),
-  ]);
+  // Cell text and the row fill are settled once per trade; didParseCell runs for all 13 cells of a row.
+  // Every cell is handed over as a finished string so autoTable has nothing left to coerce.
+  const tradeRows = new Array(trades.length);
+  const rowFills = new Array(trades.length);
+  trades.forEach((t, i) => {
+    rowFills[i] = t.outcome === 'WIN' ? GREEN_BG : t.outcome === 'LOSS' ? RED_BG : null;
+    tradeRows[i] = [
+      String(t.tradeNum),
+      t.direction,
+      t.entryPrice?.toFixed(4),
+      t.atr?.toFixed(4),
+      t.slMultiple + 'x',
+      t.tpMultiple + 'x',
+      t.leverage + 'x',
+      t.slPrice?.toFixed(4),
+      t.tpPrice?.toFixed(4),
+      '1:' + t.rr?.toFixed(2),
+      t.outcome,
+      (t.pnl >= 0 ? '+$' : '-$') + Math.abs(t.pnl).toFixed(2),
+      '$' + t.capitalAfter?.toFixed(2),
+    ];
+  });
 
   autoTable(doc, {
     startY: y,
     margin: { left: margin, right: margin },
-    head: [['#', 'DIR', 'ENTRY', 'ATR', 'SL', 'TP', 'LEV', 'SL $', 'TP $', 'R:R', 'RESULT', 'P&L', 'CAPITAL']],
+    head: TRADE_LOG_HEAD,
     body: tradeRows,
-    styles: { font: 'helvetica', fontSize: 8, cellPadding: 1.5, lineColor: [220, 220, 220], lineWidth: 0.2 },
-    headStyles: { fillColor: LIGHT_GREY, textColor: BLACK, fontStyle: 'bold', fontSize: 8 },
-    bodyStyles: { textColor: BLACK },
+    ...TRADE_LOG_TABLE_STYLE,
     didParseCell(data) {
       if (data.section === 'body') {
-        const row = trades[data.row.index];
-        if (row?.outcome === 'WIN') data.cell.styles.fillColor = GREEN_BG;
-        else if (row?.outcome === 'LOSS') data.cell.styles.fillColor = RED_BG;
+        const fill = rowFills[data.row.index];
+        if (fill) data.cell.styles.fillColor = fill;
       }
     },
     didDrawPage(data) {
-      addHeader(doc, 'COMPLETE TRADE LOG', sessionName);
+      addHeader(doc, 'COMPLETE TRADE LOG');
       addFooter(doc, doc.internal.getNumberOfPages(), sessionName);
     },
   });
@@ -312,7 +481,7 @@ export async function generatePDF({ trades, stats, session, aiAnalysis, equityCu
   onProgress?.('Formatting AI analysis...');
   if (aiAnalysis) {
     doc.addPage();
-    addHeader(doc, 'AI STRATEGY ANALYSIS', sessionName);
+    addHeader(doc, 'AI STRATEGY ANALYSIS');
     addFooter(doc, doc.internal.getNumberOfPages(), sessionName);
     y = sectionHeading(doc, 'AI STRATEGY ANALYSIS', 26);
 
@@ -322,9 +491,9 @@ export async function generatePDF({ trades, stats, session, aiAnalysis, equityCu
     doc.text('Analysis generated by Claude AI based on complete session data', margin, y);
     y += 8;
 
-    // Win/Loss ratio
-    const wins = trades.filter(t => t.outcome === 'WIN').length;
-    const losses = trades.filter(t => t.outcome === 'LOSS').length;
+    // Win/Loss ratio, already counted by the stats pass
+    const wins = stats?.wins ?? 0;
+    const losses = stats?.losses ?? 0;
     const wr = trades.length > 0 ? (wins / trades.length * 100).toFixed(0) : 0;
     doc.setFontSize(20);
     doc.setFont('helvetica', 'bold');
@@ -334,12 +503,12 @@ export async function generatePDF({ trades, stats, session, aiAnalysis, equityCu
 
     // Parse and render sections
     const lines = aiAnalysis.split('\n');
-    const SECTIONS_UPPER = ['STRATEGY OVERVIEW', 'SL MULTIPLE ANALYSIS', 'TP MULTIPLE ANALYSIS', 'LEVERAGE ASSESSMENT', 'DIRECTIONAL BIAS', 'PATTERN OBSERVATIONS', 'RISK MANAGEMENT SCORE', 'THREE RECOMMENDATIONS', 'VERDICT'];
 
     let current = null;
     const parsed = [];
     for (const line of lines) {
-      const match = SECTIONS_UPPER.find(s => line.toUpperCase().startsWith(s + ':') || line.toUpperCase() === s + ':');
+      const upper = line.toUpperCase();
+      const match = AI_SECTIONS.find(s => upper.startsWith(s + ':'));
       if (match) {
         if (current) parsed.push(current);
         current = { title: match, content: line.replace(new RegExp(`^${match}:?\\s*`, 'i'), '').trim() };
@@ -354,7 +523,7 @@ export async function generatePDF({ trades, stats, session, aiAnalysis, equityCu
     for (const section of parsed.filter(s => s.title !== 'VERDICT')) {
       if (y > h - 50) {
         doc.addPage();
-        addHeader(doc, 'AI STRATEGY ANALYSIS', sessionName);
+        addHeader(doc, 'AI STRATEGY ANALYSIS');
         addFooter(doc, doc.internal.getNumberOfPages(), sessionName);
         y = 28;
       }
@@ -376,7 +545,7 @@ export async function generatePDF({ trades, stats, session, aiAnalysis, equityCu
     if (verdict) {
       if (y > h - 40) {
         doc.addPage();
-        addHeader(doc, 'AI STRATEGY ANALYSIS', sessionName);
+        addHeader(doc, 'AI STRATEGY ANALYSIS');
         addFooter(doc, doc.internal.getNumberOfPages(), sessionName);
         y = 28;
       }
@@ -394,7 +563,8 @@ export async function generatePDF({ trades, stats, session, aiAnalysis, equityCu
 
   // ── DOWNLOAD ──────────────────────────────────────────────────────
   onProgress?.('Download ready.');
-  const filename = `TP-SL-Pro-Report-${(sessionName || 'Session').replace(/\s+/g, '-')}-${new Date().toISOString().slice(0, 10)}.pdf`;
-  doc.save(filename);
+  const blob = doc.output('blob');
+  reportCache.set(trades, { blob, aiAnalysis, sessionName, currency, dateStr });
+  downloadBlob(blob, filename);
   return filename;
 }
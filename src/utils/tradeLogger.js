@@ -1,24 +1,38 @@
-import { calcTrade, applyTradeOutcome } from './calculations.js';
+import { calcTrade, roundCents, toNumber } from './calculations.js';
+import { downloadBlob } from './download.js';
 
 export function createTradeRecord({ tradeNum, date, direction, entryPrice, atr, slMultiple, tpPrice: tpPriceInput, tpMultiple, leverage, capital, outcome }) {
-  const calc = calcTrade({ direction, entryPrice, atr, slMultiple, tpPrice: tpPriceInput, tpMultiple, leverage, capital });
-  const pnl = outcome === 'WIN' ? calc.maxGain : -calc.maxLoss;
-  const capitalAfter = capital + pnl;
+  // Coerce the form strings once; calcTrade and the stored record share the numbers
+  const entry = toNumber(entryPrice);
+  const atrNum = toNumber(atr);
+  const slMult = toNumber(slMultiple);
+  const lev = toNumber(leverage);
+  const calc = calcTrade({ direction, entryPrice: entry, atr: atrNum, slMultiple: slMult, tpPrice: tpPriceInput, tpMultiple, leverage: lev, capital });
+  const pnl = roundCents(outcome === 'WIN' ? calc.maxGain : -calc.maxLoss);
+  const capitalAfter = roundCents(capital + pnl);
 
-  // Derive tpMultiple from calc for storage/reporting
-  const atrVal = parseFloat(atr) || 1;
-  const derivedTpMult = atrVal > 0 ? parseFloat((calc.tpDist / atrVal).toFixed(2)) : 0;
+  // Derive tpMultiple from calc for storage/reporting, rounded to 2dp without a string round-trip
+  let tpMult;
+  if (tpPriceInput) {
+    const atrVal = atrNum || 1;
+    tpMult = atrVal > 0 ? Math.round((calc.tpDist / atrVal) * 100) / 100 : 0;
+  } else {
+    tpMult = toNumber(tpMultiple);
+  }
+
+  // Read the clock once so the stored date and timestamp always describe the same instant
+  const when = date ? new Date(date) : new Date();
 
   return {
     tradeNum,
-    date: date || new Date().toISOString().slice(0, 10),
-    timestamp: date ? new Date(date).getTime() : Date.now(),
+    date: date || when.toISOString().slice(0, 10),
+    timestamp: when.getTime(),
     direction,
-    entryPrice: parseFloat(entryPrice),
-    atr: parseFloat(atr),
-    slMultiple: parseFloat(slMultiple),
-    tpMultiple: tpPriceInput ? derivedTpMult : parseFloat(tpMultiple),
-    leverage: parseFloat(leverage),
+    entryPrice: entry,
+    atr: atrNum,
+    slMultiple: slMult,
+    tpMultiple: tpMult,
+    leverage: lev,
     slPrice: calc.slPrice,
     tpPrice: calc.tpPrice,
     rr: calc.rr,
@@ -31,9 +45,26 @@ export function createTradeRecord({ tradeNum, date, direction, entryPrice, atr,
   };
 }
 
-export function exportCSV(trades, sessionName) {
-  const headers = ['#', 'Timestamp', 'Direction', 'Entry', 'ATR', 'SL Mult', 'TP Mult', 'Leverage', 'SL Price', 'TP Price', 'R:R', 'Outcome', 'P&L ($)', 'Capital After'];
-  const rows = trades.map(t => [
+// Compounds a batch of entry rows into trade records in one loop, each trade sizing off the capital the previous one left
+export function createTradeRecords(rows, startingCapital) {
+  const n = rows.length;
+  const trades = new Array(n);
+  let capital = startingCapital;
+  for (let i = 0; i < n; i++) {
+    const r = rows[i];
+    const trade = createTradeRecord({ tradeNum: i + 1, date: r.date, direction: r.direction, entryPrice: r.entryPrice, atr: r.atr, slMultiple: r.slMultiple, tpPrice: r.tpPrice, leverage: r.leverage, capital, outcome: r.outcome });
+    capital = trade.capitalAfter;
+    trades[i] = trade;
+  }
+  return trades;
+}
+
+const CSV_HEADERS = ['#', 'Timestamp', 'Direction', 'Entry', 'ATR', 'SL Mult', 'TP Mult', 'Leverage', 'SL Price', 'TP Price', 'SL %', 'TP %', 'R:R', 'Outcome', 'P&L ($)', 'Capital After'];
+
+function csvRow(t) {
+  // Percent distances are derived here rather than stored on every trade; abs() covers both directions
+  const pctPerUnit = t.entryPrice > 0 ? 100 / t.entryPrice : 0;
+  return [
     t.tradeNum,
     new Date(t.timestamp).toISOString(),
     t.direction,
@@ -44,33 +75,37 @@ export function exportCSV(trades, sessionName) {
     t.leverage,
     t.slPrice?.toFixed(4),
     t.tpPrice?.toFixed(4),
+    (Math.abs(t.entryPrice - t.slPrice) * pctPerUnit).toFixed(2),
+    (Math.abs(t.tpPrice - t.entryPrice) * pctPerUnit).toFixed(2),
     t.rr?.toFixed(2),
     t.outcome,
     t.pnl?.toFixed(2),
     t.capitalAfter?.toFixed(2),
-  ]);
+  ].join(',');
+}
+
+// Repeat exports of an unchanged trade log reuse the serialized file
+const csvCache = new WeakMap();
 
-  const csv = [headers, ...rows].map(r => r.join(',')).join('\n');
-  const blob = new Blob([csv], { type: 'text/csv' });
-  const url = URL.createObjectURL(blob);
-  const a = document.createElement('a');
-  a.href = url;
-  a.download = `TP-SL-Pro-Trades-${sessionName || 'Session'}-${new Date().toISOString().slice(0, 10)}.csv`;
-  a.click();
-  URL.revokeObjectURL(url);
+function csvBlob(trades) {
+  let blob = csvCache.get(trades);
+  if (!blob) {
+    // One Blob part per row: the browser concatenates them natively, no full-file JS string
+    blob = new Blob([CSV_HEADERS.join(','), ...trades.map(t => '\n' + csvRow(t))], { type: 'text/csv' });
+    csvCache.set(trades, blob);
+  }
+  return blob;
+}
+
+export function exportCSV(trades, sessionName) {
+  downloadBlob(csvBlob(trades), `TP-SL-Pro-Trades-${sessionName || 'Session'}-${new Date().toISOString().slice(0, 10)}.csv`);
 }
 
 export function downloadCSVTemplate() {
   const headers = ['Direction', 'Entry Price', 'ATR', 'SL Multiple', 'TP Multiple', 'Leverage', 'Outcome'];
   const example = ['LONG', '1.2345', '0.0050', '1.0', '2.0', '1', 'WIN'];
   const csv = [headers, example].map(r => r.join(',')).join('\n');
-  const blob = new Blob([csv], { type: 'text/csv' });
-  const url = URL.createObjectURL(blob);
-  const a = document.createElement('a');
-  a.href = url;
-  a.download = 'TP-SL-Pro-Template.csv';
-  a.click();
-  URL.revokeObjectURL(url);
+  downloadBlob(new Blob([csv], { type: 'text/csv' }), 'TP-SL-Pro-Template.csv');
 }
 
 export function parseCSV(text) {